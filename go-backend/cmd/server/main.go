@@ -18,7 +18,7 @@ func main() {
 	}
 
 	// Initialize database
-	db, err := database.Initialize(cfg.DatabasePath)
+	db, err := database.Initialize(cfg)
 	if err != nil {
 		log.Fatalf("Failed to initialize database: %v", err)
 	}
@@ -26,10 +26,16 @@ func main() {
 	// Initialize handlers
 	h := handlers.New(db, cfg)
 
-	// Setup Gin router
-	r := gin.Default()
+	// Gin reads GIN_MODE before .env is loaded, so apply it explicitly;
+	// release mode skips per-route debug output at startup
+	gin.SetMode(cfg.GinMode)
+
+	// Setup Gin router. gin.Default() would also install gin's own
+	// request logger, logging every request twice alongside ours
+	r := gin.New()
 
 	// Add middleware
+	r.Use(gin.Recovery())
 	r.Use(middleware.CORS())
 	r.Use(middleware.Logger())
 	r.Use(middleware.ErrorHandler())
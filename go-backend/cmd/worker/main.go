@@ -16,7 +16,7 @@ func main() {
 	}
 
 	// Initialize database
-	db, err := database.Initialize(cfg.DatabasePath)
+	db, err := database.Initialize(cfg)
 	if err != nil {
 		log.Fatalf("Failed to initialize database: %v", err)
 	}
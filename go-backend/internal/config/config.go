@@ -10,11 +10,15 @@ import (
 
 type Config struct {
 	// Database
-	DatabasePath string
+	DatabasePath      string
+	DBMaxOpenConns    int
+	DBMaxIdleConns    int
+	DBConnMaxLifetime int // seconds
 
 	// Server
 	ServerHost string
 	ServerPort string
+	GinMode    string
 
 	// File Upload
 	UploadDir            string
@@ -31,6 +35,9 @@ type Config struct {
 	EMBAScanProfile     string
 	EMBAThreads         int
 
+	// Worker
+	WorkerConcurrency int
+
 	// External APIs
 	ShodanAPIKey     string
 	VirusTotalAPIKey string
@@ -42,8 +49,12 @@ func Load() (*Config, error) {
 
 	cfg := &Config{
 		DatabasePath:        getEnv("DATABASE_PATH", "./odin.db"),
+		DBMaxOpenConns:      getEnvAsInt("DB_MAX_OPEN_CONNS", 20),
+		DBMaxIdleConns:      getEnvAsInt("DB_MAX_IDLE_CONNS", 10),
+		DBConnMaxLifetime:   getEnvAsInt("DB_CONN_MAX_LIFETIME", 1800),
 		ServerHost:         getEnv("SERVER_HOST", "0.0.0.0"),
 		ServerPort:         getEnv("SERVER_PORT", "8080"),
+		GinMode:            getEnv("GIN_MODE", "debug"),
 		UploadDir:          getEnv("UPLOAD_DIR", "/tmp/odin/uploads"),
 		WorkDir:            getEnv("WORK_DIR", "/tmp/odin/work"),
 		MaxFileSize:        getEnvAsInt64("MAX_FILE_SIZE", 524288000), // 500MB
@@ -55,6 +66,7 @@ func Load() (*Config, error) {
 		EMBAEnableLiveTesting: getEnvAsBool("EMBA_ENABLE_LIVE_TESTING", false),
 		EMBAScanProfile:      getEnv("EMBA_SCAN_PROFILE", "default-scan.emba"),
 		EMBAThreads:          getEnvAsInt("EMBA_THREADS", 2),
+		WorkerConcurrency:    getEnvAsInt("WORKER_CONCURRENCY", 1),
 		ShodanAPIKey:       getEnv("SHODAN_API_KEY", ""),
 		VirusTotalAPIKey:   getEnv("VIRUSTOTAL_API_KEY", ""),
 	}
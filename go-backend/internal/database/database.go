@@ -1,30 +1,51 @@
 package database
 
 import (
+	"odin-backend/internal/config"
 	"odin-backend/internal/models"
 	"os"
 	"path/filepath"
+	"time"
 
 	"gorm.io/driver/sqlite"
 	"gorm.io/gorm"
 	"gorm.io/gorm/logger"
 )
 
-func Initialize(databasePath string) (*gorm.DB, error) {
-	// Ensure database directory exists
-	dir := filepath.Dir(databasePath)
-	if err := os.MkdirAll(dir, 0755); err != nil {
-		return nil, err
+// CreateBatchSize is the number of rows sent per INSERT for bulk creates
+const CreateBatchSize = 1000
+
+func Initialize(cfg *config.Config) (*gorm.DB, error) {
+	// Ensure database directory exists; the working directory always does
+	if dir := filepath.Dir(cfg.DatabasePath); dir != "." {
+		if err := os.MkdirAll(dir, 0755); err != nil {
+			return nil, err
+		}
 	}
 
-	// Open SQLite database
-	db, err := gorm.Open(sqlite.Open(databasePath), &gorm.Config{
+	// Open SQLite database in WAL mode so the server and worker can read
+	// while the other writes, waiting on locks instead of failing fast.
+	// With WAL, synchronous=NORMAL only fsyncs at checkpoints, which keeps
+	// large result batches from paying an fsync per transaction
+	dsn := cfg.DatabasePath + "?_journal_mode=WAL&_busy_timeout=5000&_synchronous=NORMAL"
+	db, err := gorm.Open(sqlite.Open(dsn), &gorm.Config{
 		Logger: logger.Default.LogMode(logger.Info),
+		// Insert slices as multi-row INSERTs of up to CreateBatchSize rows
+		CreateBatchSize: CreateBatchSize,
 	})
 	if err != nil {
 		return nil, err
 	}
 
+	// Configure the connection pool so concurrent requests reuse connections
+	sqlDB, err := db.DB()
+	if err != nil {
+		return nil, err
+	}
+	sqlDB.SetMaxOpenConns(cfg.DBMaxOpenConns)
+	sqlDB.SetMaxIdleConns(cfg.DBMaxIdleConns)
+	sqlDB.SetConnMaxLifetime(time.Duration(cfg.DBConnMaxLifetime) * time.Second)
+
 	// Auto migrate the schema
 	err = db.AutoMigrate(
 		&models.Project{},
@@ -38,3 +59,32 @@ func Initialize(databasePath string) (*gorm.DB, error) {
 
 	return db, nil
 }
+
+// SeverityCounts returns the number of findings and CVE findings per risk
+// level for a project, aggregated by the database instead of in Go
+func SeverityCounts(db *gorm.DB, projectID string) (map[models.RiskLevel]int, error) {
+	var rows []struct {
+		Severity models.RiskLevel
+		Count    int
+	}
+
+	err := db.Raw(`SELECT severity, COUNT(*) AS count FROM findings WHERE project_id = ? GROUP BY severity
+		UNION ALL
+		SELECT severity_level, COUNT(*) FROM cve_findings WHERE project_id = ? GROUP BY severity_level`,
+		projectID, projectID).Scan(&rows).Error
+	if err != nil {
+		return nil, err
+	}
+
+	counts := map[models.RiskLevel]int{
+		models.RiskLow:      0,
+		models.RiskMedium:   0,
+		models.RiskHigh:     0,
+		models.RiskCritical: 0,
+	}
+	for _, row := range rows {
+		counts[row.Severity] += row.Count
+	}
+
+	return counts, nil
+}
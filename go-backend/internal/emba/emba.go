@@ -1,23 +1,52 @@
 package emba
 
 import (
+	"context"
 	"encoding/json"
+	"errors"
 	"fmt"
 	"log"
 	"os"
 	"os/exec"
 	"path/filepath"
 	"regexp"
+	"sort"
 	"strconv"
 	"strings"
+	"sync"
 	"time"
 
 	"odin-backend/internal/config"
 	"odin-backend/internal/models"
 )
 
+// versionProbeTimeout bounds the "emba -V" call used to read the version
+const versionProbeTimeout = 10 * time.Second
+
+// versionProbeWaitDelay is how long the probe waits for its output pipe to
+// close after the script is killed, in case a child process still holds it
+const versionProbeWaitDelay = 2 * time.Second
+
+// Patterns used while parsing EMBA output, compiled once at startup
+var (
+	cveIDRegex = regexp.MustCompile(`CVE-\d{4}-\d+`)
+	cweIDRegex = regexp.MustCompile(`CWE-\d+`)
+)
+
+// vulnerabilityKeywords mark a line in a vulnerability report as a finding
+var vulnerabilityKeywords = []string{
+	"vulnerability", "weak", "insecure", "hardcoded", "password",
+	"credential", "key", "exploit", "backdoor",
+}
+
 type Service struct {
 	config *config.Config
+
+	// EMBA's version does not change while the process runs, so once a
+	// probe succeeds it is reused rather than spawning "emba -V" for every
+	// analysis. A failed probe is not cached and is retried next time
+	versionMu sync.Mutex
+	version   string
 }
 
 type AnalysisResult struct {
@@ -158,10 +187,10 @@ func (s *Service) parseEMBAResults(logDir, jobID string) (*ParsedResults, error)
 
 	// Look for EMBA specific output files
 	// EMBA creates structured output in specific directories
-	
+	listing := newLogDirListing(logDir)
+
 	// Parse grep-able log file (created with -g flag)
-	grepLogFile := filepath.Join(logDir, "fw_grep.log")
-	if _, err := os.Stat(grepLogFile); err == nil {
+	if grepLogFile, ok := listing.file("fw_grep.log"); ok {
 		s.parseGrepLog(grepLogFile, results)
 	}
 
@@ -175,24 +204,23 @@ func (s *Service) parseEMBAResults(logDir, jobID string) (*ParsedResults, error)
 	}
 
 	// Parse text reports from specific EMBA modules
-	s.parseModuleReports(logDir, results)
+	s.parseModuleReports(listing, results)
 
 	// Parse advanced module outputs if enabled
 	if s.config.EMBAEnableEmulation {
-		s.parseEmulationResults(logDir, results)
+		s.parseEmulationResults(listing, results)
 	}
 	
 	if s.config.EMBAEnableCWECheck {
-		s.parseCWECheckerResults(logDir, results)
+		s.parseCWECheckerResults(listing, results)
 	}
 	
 	if s.config.EMBAEnableLiveTesting {
-		s.parseLiveTestingResults(logDir, results)
+		s.parseLiveTestingResults(listing, results)
 	}
 
 	// Parse web report data if available
-	webReportDir := filepath.Join(logDir, "html-report")
-	if _, err := os.Stat(webReportDir); err == nil {
+	if webReportDir, ok := listing.file("html-report"); ok {
 		s.parseWebReportData(webReportDir, results)
 	}
 	
@@ -200,17 +228,20 @@ func (s *Service) parseEMBAResults(logDir, jobID string) (*ParsedResults, error)
 	s.parseSBOMData(logDir, results)
 	
 	// Parse advanced extraction modules
-	s.parseAdvancedExtractionModules(logDir, results)
+	s.parseAdvancedExtractionModules(listing, results)
+
+	results.Findings = s.dedupeFindings(results.Findings)
 
 	// Generate summary based on parsed data
+	severityCounts := s.countBySeverity(results.Findings, results.CVEs)
 	results.Summary = map[string]interface{}{
 		"total_findings":    len(results.Findings),
 		"total_cves":       len(results.CVEs),
 		"total_osint":      len(results.OSINTResults),
-		"critical_count":   s.countBySeverity(results.Findings, results.CVEs, "critical"),
-		"high_count":       s.countBySeverity(results.Findings, results.CVEs, "high"),
-		"medium_count":     s.countBySeverity(results.Findings, results.CVEs, "medium"),
-		"low_count":        s.countBySeverity(results.Findings, results.CVEs, "low"),
+		"critical_count":   severityCounts[models.RiskCritical],
+		"high_count":       severityCounts[models.RiskHigh],
+		"medium_count":     severityCounts[models.RiskMedium],
+		"low_count":        severityCounts[models.RiskLow],
 		"analysis_time":    time.Now().UTC().Format(time.RFC3339),
 		"emba_version":     s.getEMBAVersion(),
 		"log_directory":    logDir,
@@ -219,24 +250,74 @@ func (s *Service) parseEMBAResults(logDir, jobID string) (*ParsedResults, error)
 	return results, nil
 }
 
+// logDirListing is the top-level listing of an EMBA log directory. It is
+// read once per parse and shared by the module parsers, instead of each
+// parser globbing (and re-reading) the directory separately
+type logDirListing struct {
+	path  string
+	names []string
+}
+
+// newLogDirListing lists logDir. A directory that cannot be read is treated
+// as empty, as filepath.Glob does
+func newLogDirListing(logDir string) *logDirListing {
+	listing := &logDirListing{path: logDir}
+
+	entries, err := os.ReadDir(logDir)
+	if err != nil {
+		return listing
+	}
+	listing.names = make([]string, len(entries))
+	for i, entry := range entries {
+		listing.names[i] = entry.Name()
+	}
+	return listing
+}
+
+// glob returns the paths of the entries whose names match pattern
+func (l *logDirListing) glob(pattern string) ([]string, error) {
+	var matches []string
+	for _, name := range l.names {
+		matched, err := filepath.Match(pattern, name)
+		if err != nil {
+			return nil, err
+		}
+		if matched {
+			matches = append(matches, filepath.Join(l.path, name))
+		}
+	}
+	return matches, nil
+}
+
+// file reports whether the directory contains name and returns its path
+func (l *logDirListing) file(name string) (string, bool) {
+	// os.ReadDir returns entries sorted by name
+	if i := sort.SearchStrings(l.names, name); i < len(l.names) && l.names[i] == name {
+		return filepath.Join(l.path, name), true
+	}
+	return "", false
+}
+
 // parseGrepLog parses the grep-able log file created by EMBA -g flag
 func (s *Service) parseGrepLog(grepLogFile string, results *ParsedResults) error {
-	content, err := os.ReadFile(grepLogFile)
+	file, err := os.Open(grepLogFile)
 	if err != nil {
 		return err
 	}
+	defer file.Close()
 
-	lines := strings.Split(string(content), "\n")
-	for _, line := range lines {
-		line = strings.TrimSpace(line)
+	scanner := newLineScanner(file)
+	for scanner.Scan() {
+		line := strings.TrimSpace(scanner.Text())
 		if line == "" {
 			continue
 		}
+		lower := strings.ToLower(line)
 
 		// Parse grep log entries for security findings
-		if strings.Contains(strings.ToLower(line), "vulnerability") ||
-		   strings.Contains(strings.ToLower(line), "cve-") ||
-		   strings.Contains(strings.ToLower(line), "exploit") {
+		if strings.Contains(lower, "vulnerability") ||
+		   strings.Contains(lower, "cve-") ||
+		   strings.Contains(lower, "exploit") {
 			
 			finding := models.Finding{
 				Title:           s.extractTitle(line),
@@ -249,7 +330,7 @@ func (s *Service) parseGrepLog(grepLogFile string, results *ParsedResults) error
 			results.Findings = append(results.Findings, finding)
 		}
 	}
-	return nil
+	return scanner.Err()
 }
 
 // parseCSVReport parses CSV reports generated by EMBA
@@ -273,20 +354,20 @@ func (s *Service) parseCSVReport(csvFile string, results *ParsedResults) error {
 	return nil
 }
 
+// moduleReportFiles are the module-specific log files EMBA creates
+var moduleReportFiles = []string{
+	"S116_qemu_version_check.txt",
+	"S115_usermode_emulator.txt",
+	"S120_cve_search.txt",
+	"S25_kernel_check.txt",
+	"S40_weak_perm_check.txt",
+}
+
 // parseModuleReports parses text reports from specific EMBA modules
-func (s *Service) parseModuleReports(logDir string, results *ParsedResults) error {
-	// EMBA creates module-specific log files
-	moduleFiles := []string{
-		"S116_qemu_version_check.txt",
-		"S115_usermode_emulator.txt", 
-		"S120_cve_search.txt",
-		"S25_kernel_check.txt",
-		"S40_weak_perm_check.txt",
-	}
-
-	for _, moduleFile := range moduleFiles {
-		fullPath := filepath.Join(logDir, moduleFile)
-		if _, err := os.Stat(fullPath); err == nil {
+func (s *Service) parseModuleReports(listing *logDirListing, results *ParsedResults) error {
+	// Check the cached directory listing instead of stat'ing each candidate
+	for _, moduleFile := range moduleReportFiles {
+		if fullPath, ok := listing.file(moduleFile); ok {
 			s.parseModuleFile(fullPath, results)
 		}
 	}
@@ -322,38 +403,66 @@ func (s *Service) parseWebReportData(webReportDir string, results *ParsedResults
 	return nil
 }
 
-// getEMBAVersion gets the EMBA version
+// getEMBAVersion gets the EMBA version, probing the script until a probe
+// succeeds
 func (s *Service) getEMBAVersion() string {
+	s.versionMu.Lock()
+	defer s.versionMu.Unlock()
+
+	if s.version == "" {
+		version, err := s.probeEMBAVersion()
+		if err != nil || version == "" {
+			return "unknown"
+		}
+		s.version = version
+	}
+	return s.version
+}
+
+// probeEMBAVersion runs "emba -V" to read the installed version
+func (s *Service) probeEMBAVersion() (string, error) {
+	// Bound the probe so a hung script cannot stall result parsing
+	ctx, cancel := context.WithTimeout(context.Background(), versionProbeTimeout)
+	defer cancel()
+
 	embaScript := filepath.Join(s.config.EMBAPath, "emba")
-	cmd := exec.Command(embaScript, "-V")
+	cmd := exec.CommandContext(ctx, embaScript, "-V")
 	cmd.Dir = s.config.EMBAPath
-	
+	// Killing the script does not close the pipe if a child inherited it,
+	// so also stop waiting for output shortly after the timeout
+	cmd.WaitDelay = versionProbeWaitDelay
+
 	output, err := cmd.Output()
 	if err != nil {
-		return "unknown"
+		return "", err
 	}
-	
-	return strings.TrimSpace(string(output))
+
+	return strings.TrimSpace(string(output)), nil
 }
 
 // parseModuleFile parses individual EMBA module output files
 func (s *Service) parseModuleFile(filePath string, results *ParsedResults) error {
-	content, err := os.ReadFile(filePath)
+	file, err := os.Open(filePath)
 	if err != nil {
 		return err
 	}
+	defer file.Close()
 
-	lines := strings.Split(string(content), "\n")
+	scanner := newLineScanner(file)
 	moduleName := filepath.Base(filePath)
-	
-	for _, line := range lines {
-		line = strings.TrimSpace(line)
+
+	// These depend only on the module, so work them out once per file
+	isCVEModule := strings.Contains(moduleName, "cve")
+	category := models.FindingType(s.getCategoryFromModule(moduleName))
+
+	for scanner.Scan() {
+		line := strings.TrimSpace(scanner.Text())
 		if line == "" || strings.HasPrefix(line, "#") {
 			continue
 		}
 
 		// Parse different types of findings based on module
-		if strings.Contains(moduleName, "cve") && strings.Contains(line, "CVE-") {
+		if isCVEModule && strings.Contains(line, "CVE-") {
 			cve := s.parseCVELine(line)
 			if cve.CVEID != "" {
 				results.CVEs = append(results.CVEs, cve)
@@ -363,34 +472,32 @@ func (s *Service) parseModuleFile(filePath string, results *ParsedResults) error
 				Title:           s.extractTitle(line),
 				Description:     line,
 				Severity:        models.RiskLevel(s.determineSeverity(line)),
-				Type:            models.FindingType(s.getCategoryFromModule(moduleName)),
+				Type:            category,
 				FilePath:        filePath,
 				FindingMetadata: map[string]interface{}{"module": moduleName, "raw_line": line},
 			}
 			results.Findings = append(results.Findings, finding)
 		}
 	}
-	
-	return nil
+
+	return scanner.Err()
 }
 
 // parseVulnerabilityCSV parses vulnerability findings from CSV files
 func (s *Service) parseVulnerabilityCSV(csvFile string) ([]models.Finding, error) {
 	var findings []models.Finding
 	
-	content, err := os.ReadFile(csvFile)
+	file, err := os.Open(csvFile)
 	if err != nil {
 		return findings, err
 	}
-
-	lines := strings.Split(string(content), "\n")
-	if len(lines) < 2 {
-		return findings, nil
-	}
+	defer file.Close()
 
 	// Skip header line
-	for i := 1; i < len(lines); i++ {
-		line := strings.TrimSpace(lines[i])
+	scanner := newLineScanner(file)
+	scanner.Scan()
+	for scanner.Scan() {
+		line := strings.TrimSpace(scanner.Text())
 		if line == "" {
 			continue
 		}
@@ -408,6 +515,9 @@ func (s *Service) parseVulnerabilityCSV(csvFile string) ([]models.Finding, error
 			findings = append(findings, finding)
 		}
 	}
+	if err := scanner.Err(); err != nil {
+		return findings, err
+	}
 
 	return findings, nil
 }
@@ -416,15 +526,19 @@ func (s *Service) parseVulnerabilityCSV(csvFile string) ([]models.Finding, error
 func (s *Service) parseCVEFile(csvFile string) ([]models.CVEFinding, error) {
 	var cves []models.CVEFinding
 
-	content, err := os.ReadFile(csvFile)
+	file, err := os.Open(csvFile)
 	if err != nil {
 		return nil, err
 	}
+	defer file.Close()
 
-	lines := strings.Split(string(content), "\n")
-	for i, line := range lines {
-		if i == 0 || strings.TrimSpace(line) == "" {
-			continue // Skip header and empty lines
+	// Skip header line
+	scanner := newLineScanner(file)
+	scanner.Scan()
+	for scanner.Scan() {
+		line := scanner.Text()
+		if strings.TrimSpace(line) == "" {
+			continue // Skip empty lines
 		}
 
 		parts := strings.Split(line, ",")
@@ -451,6 +565,9 @@ func (s *Service) parseCVEFile(csvFile string) ([]models.CVEFinding, error) {
 			cves = append(cves, cve)
 		}
 	}
+	if err := scanner.Err(); err != nil {
+		return nil, err
+	}
 
 	return cves, nil
 }
@@ -459,14 +576,17 @@ func (s *Service) parseCVEFile(csvFile string) ([]models.CVEFinding, error) {
 func (s *Service) parseVulnerabilityFile(vulnFile string) ([]models.Finding, error) {
 	var findings []models.Finding
 
-	content, err := os.ReadFile(vulnFile)
+	file, err := os.Open(vulnFile)
 	if err != nil {
 		return nil, err
 	}
+	defer file.Close()
 
-	lines := strings.Split(string(content), "\n")
-	for i, line := range lines {
-		line = strings.TrimSpace(line)
+	scanner := newLineScanner(file)
+	lineNumber := 0
+	for scanner.Scan() {
+		lineNumber++
+		line := strings.TrimSpace(scanner.Text())
 		if line == "" {
 			continue
 		}
@@ -479,13 +599,16 @@ func (s *Service) parseVulnerabilityFile(vulnFile string) ([]models.Finding, err
 				Description:     line,
 				Severity:        models.RiskLevel(s.determineSeverity(line)),
 				FilePath:        vulnFile,
-				LineNumber:      i + 1,
+				LineNumber:      lineNumber,
 				Content:         line,
 				FindingMetadata: map[string]interface{}{"source": "vulnerability_file"},
 			}
 			findings = append(findings, finding)
 		}
 	}
+	if err := scanner.Err(); err != nil {
+		return nil, err
+	}
 
 	return findings, nil
 }
@@ -549,14 +672,7 @@ func (s *Service) classifySeverity(text string) string {
 }
 
 func (s *Service) containsVulnerabilityKeywords(text string) bool {
-	keywords := []string{"vulnerability", "weak", "insecure", "hardcoded", "password", "credential", "key", "exploit", "backdoor"}
-	textLower := strings.ToLower(text)
-	for _, keyword := range keywords {
-		if strings.Contains(textLower, keyword) {
-			return true
-		}
-	}
-	return false
+	return containsAny(strings.ToLower(text), vulnerabilityKeywords)
 }
 
 func (s *Service) truncateString(str string, maxLen int) string {
@@ -566,19 +682,45 @@ func (s *Service) truncateString(str string, maxLen int) string {
 	return str[:maxLen] + "..."
 }
 
-func (s *Service) countBySeverity(findings []models.Finding, cves []models.CVEFinding, severity string) int {
-	count := 0
+// findingKey identifies a finding by what it reports and where it was seen.
+// Most parsers use a fixed title and leave the line number unset, so the
+// raw line (Description) is what tells their findings apart
+type findingKey struct {
+	Type        models.FindingType
+	Title       string
+	Description string
+	FilePath    string
+	LineNumber  int
+	Content     string
+}
+
+// dedupeFindings drops findings that repeat an earlier one exactly, keeping
+// the first occurrence. A log that repeats a line verbatim would otherwise
+// yield one stored and counted finding per copy
+func (s *Service) dedupeFindings(findings []models.Finding) []models.Finding {
+	seen := make(map[findingKey]struct{}, len(findings))
+	unique := findings[:0]
 	for _, f := range findings {
-		if string(f.Severity) == severity {
-			count++
+		key := findingKey{f.Type, f.Title, f.Description, f.FilePath, f.LineNumber, f.Content}
+		if _, dup := seen[key]; dup {
+			continue
 		}
+		seen[key] = struct{}{}
+		unique = append(unique, f)
+	}
+	return unique
+}
+
+// countBySeverity tallies findings and CVEs per risk level in a single pass
+func (s *Service) countBySeverity(findings []models.Finding, cves []models.CVEFinding) map[models.RiskLevel]int {
+	counts := make(map[models.RiskLevel]int, 5)
+	for _, f := range findings {
+		counts[f.Severity]++
 	}
 	for _, c := range cves {
-		if string(c.SeverityLevel) == severity {
-			count++
-		}
+		counts[c.SeverityLevel]++
 	}
-	return count
+	return counts
 }
 
 func (s *Service) mapJSONToFinding(jsonFinding map[string]interface{}) models.Finding {
@@ -642,9 +784,7 @@ func (s *Service) extractLocation(line string) string {
 // parseCVELine parses a single CVE from a text line
 func (s *Service) parseCVELine(line string) models.CVEFinding {
 	// Extract CVE ID using regex
-	cvePattern := `CVE-\d{4}-\d+`
-	re := regexp.MustCompile(cvePattern)
-	matches := re.FindStringSubmatch(line)
+	matches := cveIDRegex.FindStringSubmatch(line)
 	
 	if len(matches) == 0 {
 		return models.CVEFinding{}
@@ -697,24 +837,23 @@ func (s *Service) parseScore(scoreStr string) float64 {
 }
 
 // parseEmulationResults parses S115 user-mode emulation results
-func (s *Service) parseEmulationResults(logDir string, results *ParsedResults) error {
+func (s *Service) parseEmulationResults(listing *logDirListing, results *ParsedResults) error {
 	// Look for S115 emulation log files
-	emulationLogPattern := filepath.Join(logDir, "S115_*")
-	emulationFiles, err := filepath.Glob(emulationLogPattern)
+	emulationFiles, err := listing.glob("S115_*")
 	if err != nil {
 		return err
 	}
 
 	for _, emulationFile := range emulationFiles {
-		content, err := os.ReadFile(emulationFile)
+		file, err := os.Open(emulationFile)
 		if err != nil {
 			log.Printf("Error reading emulation file %s: %v", emulationFile, err)
 			continue
 		}
 
-		lines := strings.Split(string(content), "\n")
-		for _, line := range lines {
-			line = strings.TrimSpace(line)
+		scanner := newLineScanner(file)
+		for scanner.Scan() {
+			line := strings.TrimSpace(scanner.Text())
 			if line == "" {
 				continue
 			}
@@ -735,40 +874,44 @@ func (s *Service) parseEmulationResults(logDir string, results *ParsedResults) e
 				results.Findings = append(results.Findings, finding)
 			}
 		}
+		if err := scanner.Err(); err != nil {
+			log.Printf("Error reading emulation file %s: %v", emulationFile, err)
+		}
+		file.Close()
 	}
 
 	return nil
 }
 
 // parseCWECheckerResults parses S120 CWE-checker results
-func (s *Service) parseCWECheckerResults(logDir string, results *ParsedResults) error {
+func (s *Service) parseCWECheckerResults(listing *logDirListing, results *ParsedResults) error {
 	// Look for CWE-checker output files
-	cweLogPattern := filepath.Join(logDir, "S120_*")
-	cweFiles, err := filepath.Glob(cweLogPattern)
+	cweFiles, err := listing.glob("S120_*")
 	if err != nil {
 		return err
 	}
 
 	for _, cweFile := range cweFiles {
-		content, err := os.ReadFile(cweFile)
+		file, err := os.Open(cweFile)
 		if err != nil {
 			log.Printf("Error reading CWE-checker file %s: %v", cweFile, err)
 			continue
 		}
 
-		lines := strings.Split(string(content), "\n")
-		for _, line := range lines {
-			line = strings.TrimSpace(line)
+		scanner := newLineScanner(file)
+		for scanner.Scan() {
+			line := strings.TrimSpace(scanner.Text())
 			if line == "" {
 				continue
 			}
 
 			// Parse CWE findings
 			if strings.Contains(line, "CWE-") {
+				lower := strings.ToLower(line)
 				severity := "medium"
-				if strings.Contains(strings.ToLower(line), "high") {
+				if strings.Contains(lower, "high") {
 					severity = "high"
-				} else if strings.Contains(strings.ToLower(line), "critical") {
+				} else if strings.Contains(lower, "critical") {
 					severity = "critical"
 				}
 
@@ -786,40 +929,43 @@ func (s *Service) parseCWECheckerResults(logDir string, results *ParsedResults)
 				results.Findings = append(results.Findings, finding)
 			}
 		}
+		if err := scanner.Err(); err != nil {
+			log.Printf("Error reading CWE-checker file %s: %v", cweFile, err)
+		}
+		file.Close()
 	}
 
 	return nil
 }
 
 // parseLiveTestingResults parses L module live testing results
-func (s *Service) parseLiveTestingResults(logDir string, results *ParsedResults) error {
+func (s *Service) parseLiveTestingResults(listing *logDirListing, results *ParsedResults) error {
 	// Parse different L module types
-	s.parseSystemEmulationResults(logDir, results)    // L10 - System emulation
-	s.parseNetworkScanResults(logDir, results)        // L15 - Nmap scanning
-	s.parseSNMPCheckResults(logDir, results)          // L20 - SNMP checks
-	s.parseUPnPHNAPResults(logDir, results)           // L22 - UPnP/HNAP checks
-	s.parseVNCCheckResults(logDir, results)           // L23 - VNC checks
-	s.parseWebCheckResults(logDir, results)           // L25 - Web application checks
+	s.parseSystemEmulationResults(listing, results)    // L10 - System emulation
+	s.parseNetworkScanResults(listing, results)        // L15 - Nmap scanning
+	s.parseSNMPCheckResults(listing, results)          // L20 - SNMP checks
+	s.parseUPnPHNAPResults(listing, results)           // L22 - UPnP/HNAP checks
+	s.parseVNCCheckResults(listing, results)           // L23 - VNC checks
+	s.parseWebCheckResults(listing, results)           // L25 - Web application checks
 	
 	return nil
 }
 
 // parseSystemEmulationResults parses L10 system emulation results
-func (s *Service) parseSystemEmulationResults(logDir string, results *ParsedResults) error {
-	l10Pattern := filepath.Join(logDir, "L10_*")
-	l10Files, err := filepath.Glob(l10Pattern)
+func (s *Service) parseSystemEmulationResults(listing *logDirListing, results *ParsedResults) error {
+	l10Files, err := listing.glob("L10_*")
 	if err != nil {
 		return err
 	}
 
 	for _, l10File := range l10Files {
-		content, err := os.ReadFile(l10File)
+		file, err := os.Open(l10File)
 		if err != nil {
 			log.Printf("Error reading L10 file %s: %v", l10File, err)
 			continue
 		}
 
-		lines := strings.Split(string(content), "\n")
+		scanner := newLineScanner(file)
 		emulationData := map[string]interface{}{
 			"architecture": "",
 			"kernel":       "",
@@ -828,20 +974,21 @@ func (s *Service) parseSystemEmulationResults(logDir string, results *ParsedResu
 			"services":     []string{},
 		}
 
-		for _, line := range lines {
-			line = strings.TrimSpace(line)
+		for scanner.Scan() {
+			line := strings.TrimSpace(scanner.Text())
 			if line == "" {
 				continue
 			}
+			lower := strings.ToLower(line)
 
 			// Parse emulation setup information
-			if strings.Contains(strings.ToLower(line), "architecture") {
+			if strings.Contains(lower, "architecture") {
 				emulationData["architecture"] = s.extractValue(line, "architecture")
 			}
-			if strings.Contains(strings.ToLower(line), "kernel") && strings.Contains(line, "version") {
+			if strings.Contains(lower, "kernel") && strings.Contains(line, "version") {
 				emulationData["kernel"] = s.extractValue(line, "kernel")
 			}
-			if strings.Contains(strings.ToLower(line), "init") && strings.Contains(line, "process") {
+			if strings.Contains(lower, "init") && strings.Contains(line, "process") {
 				emulationData["init_process"] = s.extractValue(line, "init")
 			}
 			if strings.Contains(line, "IP:") || strings.Contains(line, "ip:") {
@@ -849,10 +996,10 @@ func (s *Service) parseSystemEmulationResults(logDir string, results *ParsedResu
 			}
 
 			// Parse emulation status and results
-			if strings.Contains(strings.ToLower(line), "emulation") && 
-			   (strings.Contains(strings.ToLower(line), "successful") || 
-			    strings.Contains(strings.ToLower(line), "started") ||
-			    strings.Contains(strings.ToLower(line), "running")) {
+			if strings.Contains(lower, "emulation") && 
+			   (strings.Contains(lower, "successful") || 
+			    strings.Contains(lower, "started") ||
+			    strings.Contains(lower, "running")) {
 				
 				finding := models.Finding{
 					Type:        models.FindingType("system_emulation"),
@@ -870,9 +1017,9 @@ func (s *Service) parseSystemEmulationResults(logDir string, results *ParsedResu
 			}
 
 			// Parse service detection
-			if strings.Contains(strings.ToLower(line), "service") && 
-			   (strings.Contains(strings.ToLower(line), "detected") ||
-			    strings.Contains(strings.ToLower(line), "running")) {
+			if strings.Contains(lower, "service") && 
+			   (strings.Contains(lower, "detected") ||
+			    strings.Contains(lower, "running")) {
 				
 				serviceName := s.extractServiceName(line)
 				if serviceName != "" {
@@ -896,6 +1043,10 @@ func (s *Service) parseSystemEmulationResults(logDir string, results *ParsedResu
 				results.Findings = append(results.Findings, finding)
 			}
 		}
+		if err := scanner.Err(); err != nil {
+			log.Printf("Error reading L10 file %s: %v", l10File, err)
+		}
+		file.Close()
 
 		// Store emulation summary
 		results.Summary["system_emulation"] = emulationData
@@ -905,28 +1056,28 @@ func (s *Service) parseSystemEmulationResults(logDir string, results *ParsedResu
 }
 
 // parseNetworkScanResults parses L15 Nmap scanning results
-func (s *Service) parseNetworkScanResults(logDir string, results *ParsedResults) error {
-	l15Pattern := filepath.Join(logDir, "L15_*")
-	l15Files, err := filepath.Glob(l15Pattern)
+func (s *Service) parseNetworkScanResults(listing *logDirListing, results *ParsedResults) error {
+	l15Files, err := listing.glob("L15_*")
 	if err != nil {
 		return err
 	}
 
 	for _, l15File := range l15Files {
-		content, err := os.ReadFile(l15File)
+		file, err := os.Open(l15File)
 		if err != nil {
 			log.Printf("Error reading L15 file %s: %v", l15File, err)
 			continue
 		}
 
-		lines := strings.Split(string(content), "\n")
+		scanner := newLineScanner(file)
 		openPorts := []map[string]interface{}{}
 
-		for _, line := range lines {
-			line = strings.TrimSpace(line)
+		for scanner.Scan() {
+			line := strings.TrimSpace(scanner.Text())
 			if line == "" {
 				continue
 			}
+			lower := strings.ToLower(line)
 
 			// Parse Nmap port scan results
 			if strings.Contains(line, "/tcp") || strings.Contains(line, "/udp") {
@@ -961,7 +1112,7 @@ func (s *Service) parseNetworkScanResults(logDir string, results *ParsedResults)
 			}
 
 			// Parse service version detection
-			if strings.Contains(strings.ToLower(line), "version") && 
+			if strings.Contains(lower, "version") && 
 			   (strings.Contains(line, ":") || strings.Contains(line, "detected")) {
 				
 				finding := models.Finding{
@@ -979,8 +1130,8 @@ func (s *Service) parseNetworkScanResults(logDir string, results *ParsedResults)
 			}
 
 			// Parse OS detection
-			if strings.Contains(strings.ToLower(line), "os") && 
-			   strings.Contains(strings.ToLower(line), "detection") {
+			if strings.Contains(lower, "os") && 
+			   strings.Contains(lower, "detection") {
 				
 				finding := models.Finding{
 					Type:        models.FindingType("os_detection"),
@@ -996,6 +1147,10 @@ func (s *Service) parseNetworkScanResults(logDir string, results *ParsedResults)
 				results.Findings = append(results.Findings, finding)
 			}
 		}
+		if err := scanner.Err(); err != nil {
+			log.Printf("Error reading L15 file %s: %v", l15File, err)
+		}
+		file.Close()
 
 		// Store network scan summary
 		results.Summary["network_scan"] = map[string]interface{}{
@@ -1008,35 +1163,35 @@ func (s *Service) parseNetworkScanResults(logDir string, results *ParsedResults)
 }
 
 // parseSNMPCheckResults parses L20 SNMP check results
-func (s *Service) parseSNMPCheckResults(logDir string, results *ParsedResults) error {
-	l20Pattern := filepath.Join(logDir, "L20_*")
-	l20Files, err := filepath.Glob(l20Pattern)
+func (s *Service) parseSNMPCheckResults(listing *logDirListing, results *ParsedResults) error {
+	l20Files, err := listing.glob("L20_*")
 	if err != nil {
 		return err
 	}
 
 	for _, l20File := range l20Files {
-		content, err := os.ReadFile(l20File)
+		file, err := os.Open(l20File)
 		if err != nil {
 			log.Printf("Error reading L20 file %s: %v", l20File, err)
 			continue
 		}
 
-		lines := strings.Split(string(content), "\n")
-		for _, line := range lines {
-			line = strings.TrimSpace(line)
+		scanner := newLineScanner(file)
+		for scanner.Scan() {
+			line := strings.TrimSpace(scanner.Text())
 			if line == "" {
 				continue
 			}
+			lower := strings.ToLower(line)
 
 			// Parse SNMP community strings
-			if strings.Contains(strings.ToLower(line), "community") && 
-			   (strings.Contains(strings.ToLower(line), "public") ||
-			    strings.Contains(strings.ToLower(line), "private") ||
-			    strings.Contains(strings.ToLower(line), "default")) {
+			if strings.Contains(lower, "community") && 
+			   (strings.Contains(lower, "public") ||
+			    strings.Contains(lower, "private") ||
+			    strings.Contains(lower, "default")) {
 				
 				severity := "medium"
-				if strings.Contains(strings.ToLower(line), "public") {
+				if strings.Contains(lower, "public") {
 					severity = "high"
 				}
 
@@ -1055,9 +1210,9 @@ func (s *Service) parseSNMPCheckResults(logDir string, results *ParsedResults) e
 			}
 
 			// Parse SNMP system information
-			if strings.Contains(strings.ToLower(line), "snmp") && 
-			   (strings.Contains(strings.ToLower(line), "system") ||
-			    strings.Contains(strings.ToLower(line), "info")) {
+			if strings.Contains(lower, "snmp") && 
+			   (strings.Contains(lower, "system") ||
+			    strings.Contains(lower, "info")) {
 				
 				finding := models.Finding{
 					Type:        models.FindingType("snmp_info"),
@@ -1073,36 +1228,40 @@ func (s *Service) parseSNMPCheckResults(logDir string, results *ParsedResults) e
 				results.Findings = append(results.Findings, finding)
 			}
 		}
+		if err := scanner.Err(); err != nil {
+			log.Printf("Error reading L20 file %s: %v", l20File, err)
+		}
+		file.Close()
 	}
 
 	return nil
 }
 
 // parseUPnPHNAPResults parses L22 UPnP/HNAP check results
-func (s *Service) parseUPnPHNAPResults(logDir string, results *ParsedResults) error {
-	l22Pattern := filepath.Join(logDir, "L22_*")
-	l22Files, err := filepath.Glob(l22Pattern)
+func (s *Service) parseUPnPHNAPResults(listing *logDirListing, results *ParsedResults) error {
+	l22Files, err := listing.glob("L22_*")
 	if err != nil {
 		return err
 	}
 
 	for _, l22File := range l22Files {
-		content, err := os.ReadFile(l22File)
+		file, err := os.Open(l22File)
 		if err != nil {
 			log.Printf("Error reading L22 file %s: %v", l22File, err)
 			continue
 		}
 
-		lines := strings.Split(string(content), "\n")
-		for _, line := range lines {
-			line = strings.TrimSpace(line)
+		scanner := newLineScanner(file)
+		for scanner.Scan() {
+			line := strings.TrimSpace(scanner.Text())
 			if line == "" {
 				continue
 			}
+			lower := strings.ToLower(line)
 
 			// Parse UPnP device discovery
-			if strings.Contains(strings.ToLower(line), "upnp") && 
-			   strings.Contains(strings.ToLower(line), "device") {
+			if strings.Contains(lower, "upnp") && 
+			   strings.Contains(lower, "device") {
 				
 				finding := models.Finding{
 					Type:        models.FindingType("upnp_device"),
@@ -1119,9 +1278,9 @@ func (s *Service) parseUPnPHNAPResults(logDir string, results *ParsedResults) er
 			}
 
 			// Parse HNAP vulnerabilities
-			if strings.Contains(strings.ToLower(line), "hnap") && 
-			   (strings.Contains(strings.ToLower(line), "vulnerable") ||
-			    strings.Contains(strings.ToLower(line), "exploit")) {
+			if strings.Contains(lower, "hnap") && 
+			   (strings.Contains(lower, "vulnerable") ||
+			    strings.Contains(lower, "exploit")) {
 				
 				finding := models.Finding{
 					Type:        models.FindingType("hnap_vulnerability"),
@@ -1137,41 +1296,45 @@ func (s *Service) parseUPnPHNAPResults(logDir string, results *ParsedResults) er
 				results.Findings = append(results.Findings, finding)
 			}
 		}
+		if err := scanner.Err(); err != nil {
+			log.Printf("Error reading L22 file %s: %v", l22File, err)
+		}
+		file.Close()
 	}
 
 	return nil
 }
 
 // parseVNCCheckResults parses L23 VNC check results
-func (s *Service) parseVNCCheckResults(logDir string, results *ParsedResults) error {
-	l23Pattern := filepath.Join(logDir, "L23_*")
-	l23Files, err := filepath.Glob(l23Pattern)
+func (s *Service) parseVNCCheckResults(listing *logDirListing, results *ParsedResults) error {
+	l23Files, err := listing.glob("L23_*")
 	if err != nil {
 		return err
 	}
 
 	for _, l23File := range l23Files {
-		content, err := os.ReadFile(l23File)
+		file, err := os.Open(l23File)
 		if err != nil {
 			log.Printf("Error reading L23 file %s: %v", l23File, err)
 			continue
 		}
 
-		lines := strings.Split(string(content), "\n")
-		for _, line := range lines {
-			line = strings.TrimSpace(line)
+		scanner := newLineScanner(file)
+		for scanner.Scan() {
+			line := strings.TrimSpace(scanner.Text())
 			if line == "" {
 				continue
 			}
+			lower := strings.ToLower(line)
 
 			// Parse VNC authentication bypass
-			if strings.Contains(strings.ToLower(line), "vnc") && 
-			   (strings.Contains(strings.ToLower(line), "no auth") ||
-			    strings.Contains(strings.ToLower(line), "authentication") ||
-			    strings.Contains(strings.ToLower(line), "bypass")) {
+			if strings.Contains(lower, "vnc") && 
+			   (strings.Contains(lower, "no auth") ||
+			    strings.Contains(lower, "authentication") ||
+			    strings.Contains(lower, "bypass")) {
 				
 				severity := "high"
-				if strings.Contains(strings.ToLower(line), "no auth") {
+				if strings.Contains(lower, "no auth") {
 					severity = "critical"
 				}
 
@@ -1189,38 +1352,42 @@ func (s *Service) parseVNCCheckResults(logDir string, results *ParsedResults) er
 				results.Findings = append(results.Findings, finding)
 			}
 		}
+		if err := scanner.Err(); err != nil {
+			log.Printf("Error reading L23 file %s: %v", l23File, err)
+		}
+		file.Close()
 	}
 
 	return nil
 }
 
 // parseWebCheckResults parses L25 web application check results
-func (s *Service) parseWebCheckResults(logDir string, results *ParsedResults) error {
-	l25Pattern := filepath.Join(logDir, "L25_*")
-	l25Files, err := filepath.Glob(l25Pattern)
+func (s *Service) parseWebCheckResults(listing *logDirListing, results *ParsedResults) error {
+	l25Files, err := listing.glob("L25_*")
 	if err != nil {
 		return err
 	}
 
 	for _, l25File := range l25Files {
-		content, err := os.ReadFile(l25File)
+		file, err := os.Open(l25File)
 		if err != nil {
 			log.Printf("Error reading L25 file %s: %v", l25File, err)
 			continue
 		}
 
-		lines := strings.Split(string(content), "\n")
-		for _, line := range lines {
-			line = strings.TrimSpace(line)
+		scanner := newLineScanner(file)
+		for scanner.Scan() {
+			line := strings.TrimSpace(scanner.Text())
 			if line == "" {
 				continue
 			}
+			lower := strings.ToLower(line)
 
 			// Parse Nikto web vulnerabilities
-			if strings.Contains(strings.ToLower(line), "nikto") && 
-			   (strings.Contains(strings.ToLower(line), "vulnerability") ||
-			    strings.Contains(strings.ToLower(line), "issue") ||
-			    strings.Contains(strings.ToLower(line), "warning")) {
+			if strings.Contains(lower, "nikto") && 
+			   (strings.Contains(lower, "vulnerability") ||
+			    strings.Contains(lower, "issue") ||
+			    strings.Contains(lower, "warning")) {
 				
 				finding := models.Finding{
 					Type:        models.FindingType("web_vulnerability"),
@@ -1238,10 +1405,10 @@ func (s *Service) parseWebCheckResults(logDir string, results *ParsedResults) er
 			}
 
 			// Parse testssl.sh results
-			if strings.Contains(strings.ToLower(line), "ssl") && 
-			   (strings.Contains(strings.ToLower(line), "vulnerable") ||
-			    strings.Contains(strings.ToLower(line), "weak") ||
-			    strings.Contains(strings.ToLower(line), "insecure")) {
+			if strings.Contains(lower, "ssl") && 
+			   (strings.Contains(lower, "vulnerable") ||
+			    strings.Contains(lower, "weak") ||
+			    strings.Contains(lower, "insecure")) {
 				
 				finding := models.Finding{
 					Type:        models.FindingType("ssl_vulnerability"),
@@ -1259,9 +1426,9 @@ func (s *Service) parseWebCheckResults(logDir string, results *ParsedResults) er
 			}
 
 			// Parse Arachni web scanner results
-			if strings.Contains(strings.ToLower(line), "arachni") && 
-			   (strings.Contains(strings.ToLower(line), "found") ||
-			    strings.Contains(strings.ToLower(line), "detected")) {
+			if strings.Contains(lower, "arachni") && 
+			   (strings.Contains(lower, "found") ||
+			    strings.Contains(lower, "detected")) {
 				
 				finding := models.Finding{
 					Type:        models.FindingType("web_vulnerability"),
@@ -1278,6 +1445,10 @@ func (s *Service) parseWebCheckResults(logDir string, results *ParsedResults) er
 				results.Findings = append(results.Findings, finding)
 			}
 		}
+		if err := scanner.Err(); err != nil {
+			log.Printf("Error reading L25 file %s: %v", l25File, err)
+		}
+		file.Close()
 	}
 
 	return nil
@@ -1354,9 +1525,7 @@ func (s *Service) parseSBOMData(logDir string, results *ParsedResults) error {
 // extractCWETitle extracts a meaningful title from CWE-checker output
 func (s *Service) extractCWETitle(line string) string {
 	// Extract CWE ID and description
-	cwePattern := `CWE-\d+`
-	re := regexp.MustCompile(cwePattern)
-	matches := re.FindStringSubmatch(line)
+	matches := cweIDRegex.FindStringSubmatch(line)
 	
 	if len(matches) > 0 {
 		return fmt.Sprintf("CWE Finding: %s", matches[0])
@@ -1366,45 +1535,48 @@ func (s *Service) extractCWETitle(line string) string {
 }
 
 // parseAdvancedExtractionModules parses results from advanced extraction modules
-func (s *Service) parseAdvancedExtractionModules(logDir string, results *ParsedResults) error {
+func (s *Service) parseAdvancedExtractionModules(listing *logDirListing, results *ParsedResults) error {
 	// Parse P modules (pre-modules for advanced extraction)
-	s.parsePreModules(logDir, results)
+	s.parsePreModules(listing, results)
 	
 	// Parse S modules (static analysis modules)
-	s.parseStaticAnalysisModules(logDir, results)
+	s.parseStaticAnalysisModules(listing, results)
 	
 	// Parse F modules (finishing modules)
-	s.parseFinishingModules(logDir, results)
+	s.parseFinishingModules(listing, results)
 	
 	return nil
 }
 
 // parsePreModules parses P module results (pre-analysis modules)
-func (s *Service) parsePreModules(logDir string, results *ParsedResults) error {
-	preModulePattern := filepath.Join(logDir, "P*")
-	preModuleFiles, err := filepath.Glob(preModulePattern)
+func (s *Service) parsePreModules(listing *logDirListing, results *ParsedResults) error {
+	preModuleFiles, err := listing.glob("P*")
 	if err != nil {
 		return err
 	}
 
 	for _, preModuleFile := range preModuleFiles {
-		content, err := os.ReadFile(preModuleFile)
+		file, err := openTextFile(preModuleFile)
 		if err != nil {
-			log.Printf("Error reading pre-module file %s: %v", preModuleFile, err)
+			if !errors.Is(err, errNotText) {
+				log.Printf("Error reading pre-module file %s: %v", preModuleFile, err)
+			}
 			continue
 		}
 
-		lines := strings.Split(string(content), "\n")
-		for _, line := range lines {
-			line = strings.TrimSpace(line)
+		moduleName := filepath.Base(preModuleFile)
+		scanner := newLineScanner(file)
+		for scanner.Scan() {
+			line := strings.TrimSpace(scanner.Text())
 			if line == "" {
 				continue
 			}
+			lower := strings.ToLower(line)
 
 			// Parse firmware information from pre-modules
-			if strings.Contains(strings.ToLower(line), "firmware") ||
-			   strings.Contains(strings.ToLower(line), "bootloader") ||
-			   strings.Contains(strings.ToLower(line), "kernel") {
+			if strings.Contains(lower, "firmware") ||
+			   strings.Contains(lower, "bootloader") ||
+			   strings.Contains(lower, "kernel") {
 				
 				finding := models.Finding{
 					Type:        models.FindingType("firmware_info"),
@@ -1414,21 +1586,24 @@ func (s *Service) parsePreModules(logDir string, results *ParsedResults) error {
 					FilePath:    preModuleFile,
 					FindingMetadata: map[string]interface{}{
 						"source": "pre_analysis",
-						"module": filepath.Base(preModuleFile),
+						"module": moduleName,
 					},
 				}
 				results.Findings = append(results.Findings, finding)
 			}
 		}
+		if err := scanner.Err(); err != nil {
+			log.Printf("Error reading pre-module file %s: %v", preModuleFile, err)
+		}
+		file.Close()
 	}
 
 	return nil
 }
 
 // parseStaticAnalysisModules parses additional S module results
-func (s *Service) parseStaticAnalysisModules(logDir string, results *ParsedResults) error {
-	staticModulePattern := filepath.Join(logDir, "S*")
-	staticModuleFiles, err := filepath.Glob(staticModulePattern)
+func (s *Service) parseStaticAnalysisModules(listing *logDirListing, results *ParsedResults) error {
+	staticModuleFiles, err := listing.glob("S*")
 	if err != nil {
 		return err
 	}
@@ -1439,24 +1614,28 @@ func (s *Service) parseStaticAnalysisModules(logDir string, results *ParsedResul
 			continue
 		}
 
-		content, err := os.ReadFile(staticModuleFile)
+		file, err := openTextFile(staticModuleFile)
 		if err != nil {
-			log.Printf("Error reading static analysis file %s: %v", staticModuleFile, err)
+			if !errors.Is(err, errNotText) {
+				log.Printf("Error reading static analysis file %s: %v", staticModuleFile, err)
+			}
 			continue
 		}
 
-		lines := strings.Split(string(content), "\n")
-		for _, line := range lines {
-			line = strings.TrimSpace(line)
+		moduleName := filepath.Base(staticModuleFile)
+		scanner := newLineScanner(file)
+		for scanner.Scan() {
+			line := strings.TrimSpace(scanner.Text())
 			if line == "" {
 				continue
 			}
+			lower := strings.ToLower(line)
 
 			// Parse various security findings from static analysis
-			if strings.Contains(strings.ToLower(line), "password") ||
-			   strings.Contains(strings.ToLower(line), "key") ||
-			   strings.Contains(strings.ToLower(line), "secret") ||
-			   strings.Contains(strings.ToLower(line), "credential") {
+			if strings.Contains(lower, "password") ||
+			   strings.Contains(lower, "key") ||
+			   strings.Contains(lower, "secret") ||
+			   strings.Contains(lower, "credential") {
 				
 				finding := models.Finding{
 					Type:        models.FindingType("credential_finding"),
@@ -1466,16 +1645,16 @@ func (s *Service) parseStaticAnalysisModules(logDir string, results *ParsedResul
 					FilePath:    staticModuleFile,
 					FindingMetadata: map[string]interface{}{
 						"source": "static_analysis",
-						"module": filepath.Base(staticModuleFile),
+						"module": moduleName,
 					},
 				}
 				results.Findings = append(results.Findings, finding)
 			}
 
 			// Parse binary analysis results
-			if strings.Contains(strings.ToLower(line), "binary") ||
-			   strings.Contains(strings.ToLower(line), "executable") ||
-			   strings.Contains(strings.ToLower(line), "library") {
+			if strings.Contains(lower, "binary") ||
+			   strings.Contains(lower, "executable") ||
+			   strings.Contains(lower, "library") {
 				
 				finding := models.Finding{
 					Type:        models.FindingType("binary_analysis"),
@@ -1485,21 +1664,24 @@ func (s *Service) parseStaticAnalysisModules(logDir string, results *ParsedResul
 					FilePath:    staticModuleFile,
 					FindingMetadata: map[string]interface{}{
 						"source": "static_analysis",
-						"module": filepath.Base(staticModuleFile),
+						"module": moduleName,
 					},
 				}
 				results.Findings = append(results.Findings, finding)
 			}
 		}
+		if err := scanner.Err(); err != nil {
+			log.Printf("Error reading static analysis file %s: %v", staticModuleFile, err)
+		}
+		file.Close()
 	}
 
 	return nil
 }
 
 // parseFinishingModules parses F module results (finishing modules)
-func (s *Service) parseFinishingModules(logDir string, results *ParsedResults) error {
-	finishingModulePattern := filepath.Join(logDir, "F*")
-	finishingModuleFiles, err := filepath.Glob(finishingModulePattern)
+func (s *Service) parseFinishingModules(listing *logDirListing, results *ParsedResults) error {
+	finishingModuleFiles, err := listing.glob("F*")
 	if err != nil {
 		return err
 	}
@@ -1510,23 +1692,27 @@ func (s *Service) parseFinishingModules(logDir string, results *ParsedResults) e
 			continue
 		}
 
-		content, err := os.ReadFile(finishingModuleFile)
+		file, err := openTextFile(finishingModuleFile)
 		if err != nil {
-			log.Printf("Error reading finishing module file %s: %v", finishingModuleFile, err)
+			if !errors.Is(err, errNotText) {
+				log.Printf("Error reading finishing module file %s: %v", finishingModuleFile, err)
+			}
 			continue
 		}
 
-		lines := strings.Split(string(content), "\n")
-		for _, line := range lines {
-			line = strings.TrimSpace(line)
+		moduleName := filepath.Base(finishingModuleFile)
+		scanner := newLineScanner(file)
+		for scanner.Scan() {
+			line := strings.TrimSpace(scanner.Text())
 			if line == "" {
 				continue
 			}
+			lower := strings.ToLower(line)
 
 			// Parse summary and aggregation results
-			if strings.Contains(strings.ToLower(line), "summary") ||
-			   strings.Contains(strings.ToLower(line), "total") ||
-			   strings.Contains(strings.ToLower(line), "count") {
+			if strings.Contains(lower, "summary") ||
+			   strings.Contains(lower, "total") ||
+			   strings.Contains(lower, "count") {
 				
 				finding := models.Finding{
 					Type:        models.FindingType("analysis_summary"),
@@ -1536,16 +1722,16 @@ func (s *Service) parseFinishingModules(logDir string, results *ParsedResults) e
 					FilePath:    finishingModuleFile,
 					FindingMetadata: map[string]interface{}{
 						"source": "finishing_analysis",
-						"module": filepath.Base(finishingModuleFile),
+						"module": moduleName,
 					},
 				}
 				results.Findings = append(results.Findings, finding)
 			}
 
 			// Parse aggregated risk assessments
-			if strings.Contains(strings.ToLower(line), "risk") ||
-			   strings.Contains(strings.ToLower(line), "score") ||
-			   strings.Contains(strings.ToLower(line), "rating") {
+			if strings.Contains(lower, "risk") ||
+			   strings.Contains(lower, "score") ||
+			   strings.Contains(lower, "rating") {
 				
 				severity := s.determineSeverity(line)
 				finding := models.Finding{
@@ -1556,12 +1742,16 @@ func (s *Service) parseFinishingModules(logDir string, results *ParsedResults) e
 					FilePath:    finishingModuleFile,
 					FindingMetadata: map[string]interface{}{
 						"source": "finishing_analysis",
-						"module": filepath.Base(finishingModuleFile),
+						"module": moduleName,
 					},
 				}
 				results.Findings = append(results.Findings, finding)
 			}
 		}
+		if err := scanner.Err(); err != nil {
+			log.Printf("Error reading finishing module file %s: %v", finishingModuleFile, err)
+		}
+		file.Close()
 	}
 
 	return nil
@@ -1,29 +1,133 @@
 package emba
 
 import (
+	"bufio"
+	"bytes"
+	"errors"
+	"io"
+	"os"
 	"regexp"
 	"strings"
 )
 
-// Helper methods for Service struct
-func (s *Service) extractValue(line, prefix string) string {
-	if strings.Contains(line, prefix) {
-		parts := strings.Split(line, prefix)
-		if len(parts) > 1 {
-			return strings.TrimSpace(parts[1])
+var (
+	// ipRegex matches IPv4 addresses
+	ipRegex = regexp.MustCompile(`\b(?:[0-9]{1,3}\.){3}[0-9]{1,3}\b`)
+	// portRegex matches port/protocol pairs such as 22/tcp
+	portRegex = regexp.MustCompile(`(\d+)/(tcp|udp)`)
+
+	// High and medium severity indicators, built once rather than on every
+	// determineSeverity call. Plain substring checks beat a regexp
+	// alternation here, since Go's regexp has no literal-set fast path
+	highSeverityKeywords = []string{
+		"critical", "high", "exploit", "rce", "remote code execution",
+		"buffer overflow", "sql injection", "authentication bypass",
+		"privilege escalation", "backdoor", "malware", "trojan",
+	}
+	mediumSeverityKeywords = []string{
+		"medium", "warning", "vulnerable", "weak", "insecure",
+		"deprecated", "outdated", "misconfiguration", "exposure",
+	}
+)
+
+// containsAny reports whether s contains any of the keywords
+func containsAny(s string, keywords []string) bool {
+	for _, keyword := range keywords {
+		if strings.Contains(s, keyword) {
+			return true
 		}
 	}
-	return ""
+	return false
 }
 
-func (s *Service) extractIPAddress(line string) string {
-	// Regex to match IP addresses
-	ipRegex := regexp.MustCompile(`\b(?:[0-9]{1,3}\.){3}[0-9]{1,3}\b`)
-	matches := ipRegex.FindAllString(line, -1)
-	if len(matches) > 0 {
-		return matches[0]
+// sniffSize is how much of a file openTextFile reads to classify it
+const sniffSize = 512
+
+// errNotText is returned by openTextFile for binaries and directories
+var errNotText = errors.New("not a text file")
+
+// openTextFile opens path for reading if it looks like a text file, judging
+// by a NUL byte in its first sniffSize bytes. Module wildcards also match
+// binaries and directories; for those it returns errNotText
+func openTextFile(path string) (*os.File, error) {
+	f, err := os.Open(path)
+	if err != nil {
+		return nil, err
+	}
+
+	if info, err := f.Stat(); err != nil {
+		f.Close()
+		return nil, err
+	} else if info.IsDir() {
+		f.Close()
+		return nil, errNotText
+	}
+
+	buf := make([]byte, sniffSize)
+	n, err := f.Read(buf)
+	if err != nil && err != io.EOF {
+		f.Close()
+		return nil, err
+	}
+	if bytes.IndexByte(buf[:n], 0) != -1 {
+		f.Close()
+		return nil, errNotText
+	}
+	if _, err := f.Seek(0, io.SeekStart); err != nil {
+		f.Close()
+		return nil, err
 	}
-	return ""
+	return f, nil
+}
+
+// maxLogLineSize is the longest single line newLineScanner returns
+const maxLogLineSize = 1 << 20
+
+// newLineScanner returns a scanner that reads r one line at a time, so EMBA
+// logs are streamed rather than loaded whole and split into a slice. Lines
+// longer than maxLogLineSize are skipped, rather than stopping the scan
+// with bufio.ErrTooLong and losing the rest of the file
+func newLineScanner(r io.Reader) *bufio.Scanner {
+	scanner := bufio.NewScanner(r)
+	scanner.Buffer(make([]byte, 0, 64*1024), maxLogLineSize)
+
+	skipping := false
+	scanner.Split(func(data []byte, atEOF bool) (int, []byte, error) {
+		if skipping {
+			// Discard the rest of an oversized line, up to its newline
+			if i := bytes.IndexByte(data, '\n'); i >= 0 {
+				skipping = false
+				return i + 1, nil, nil
+			}
+			return len(data), nil, nil
+		}
+
+		advance, token, err := bufio.ScanLines(data, atEOF)
+		if advance == 0 && token == nil && err == nil && len(data) >= maxLogLineSize {
+			// The buffer is full without a newline in sight
+			skipping = true
+			return len(data), nil, nil
+		}
+		return advance, token, err
+	})
+	return scanner
+}
+
+// Helper methods for Service struct
+func (s *Service) extractValue(line, prefix string) string {
+	// Take the text between the first and any second occurrence of prefix,
+	// without splitting the whole line into a slice
+	_, value, found := strings.Cut(line, prefix)
+	if !found {
+		return ""
+	}
+	value, _, _ = strings.Cut(value, prefix)
+	return strings.TrimSpace(value)
+}
+
+func (s *Service) extractIPAddress(line string) string {
+	// Only the first address is used, so stop at the first match
+	return ipRegex.FindString(line)
 }
 
 func (s *Service) extractServiceName(line string) string {
@@ -50,7 +154,6 @@ func (s *Service) extractServiceName(line string) string {
 
 func (s *Service) parsePortInfo(line string) (string, string) {
 	// Parse port and protocol from line
-	portRegex := regexp.MustCompile(`(\d+)/(tcp|udp)`)
 	matches := portRegex.FindStringSubmatch(line)
 	if len(matches) >= 3 {
 		return matches[1], matches[2]
@@ -58,64 +161,47 @@ func (s *Service) parsePortInfo(line string) (string, string) {
 	return "", ""
 }
 
+// highRiskPorts lists well-known ports whose exposure is reported as high risk
+var highRiskPorts = map[string]bool{
+	"21":   true, // FTP
+	"22":   true, // SSH
+	"23":   true, // Telnet
+	"25":   true, // SMTP
+	"53":   true, // DNS
+	"80":   true, // HTTP
+	"110":  true, // POP3
+	"135":  true, // RPC
+	"139":  true, // NetBIOS
+	"143":  true, // IMAP
+	"443":  true, // HTTPS
+	"445":  true, // SMB
+	"993":  true, // IMAPS
+	"995":  true, // POP3S
+	"1433": true, // MSSQL
+	"1521": true, // Oracle
+	"3306": true, // MySQL
+	"3389": true, // RDP
+	"5432": true, // PostgreSQL
+	"5900": true, // VNC
+	"6379": true, // Redis
+	"8080": true, // HTTP Alt
+	"8443": true, // HTTPS Alt
+}
+
 func (s *Service) isHighRiskPort(port string) bool {
-	highRiskPorts := map[string]bool{
-		"21":   true, // FTP
-		"22":   true, // SSH
-		"23":   true, // Telnet
-		"25":   true, // SMTP
-		"53":   true, // DNS
-		"80":   true, // HTTP
-		"110":  true, // POP3
-		"135":  true, // RPC
-		"139":  true, // NetBIOS
-		"143":  true, // IMAP
-		"443":  true, // HTTPS
-		"445":  true, // SMB
-		"993":  true, // IMAPS
-		"995":  true, // POP3S
-		"1433": true, // MSSQL
-		"1521": true, // Oracle
-		"3306": true, // MySQL
-		"3389": true, // RDP
-		"5432": true, // PostgreSQL
-		"5900": true, // VNC
-		"6379": true, // Redis
-		"8080": true, // HTTP Alt
-		"8443": true, // HTTPS Alt
-	}
-	
 	return highRiskPorts[port]
 }
 
 func (s *Service) determineSeverity(finding string) string {
 	finding = strings.ToLower(finding)
-	
-	// High severity indicators
-	highSeverityKeywords := []string{
-		"critical", "high", "exploit", "rce", "remote code execution",
-		"buffer overflow", "sql injection", "authentication bypass",
-		"privilege escalation", "backdoor", "malware", "trojan",
-	}
-	
-	// Medium severity indicators
-	mediumSeverityKeywords := []string{
-		"medium", "warning", "vulnerable", "weak", "insecure",
-		"deprecated", "outdated", "misconfiguration", "exposure",
-	}
-	
-	for _, keyword := range highSeverityKeywords {
-		if strings.Contains(finding, keyword) {
-			return "high"
-		}
+
+	if containsAny(finding, highSeverityKeywords) {
+		return "high"
 	}
-	
-	for _, keyword := range mediumSeverityKeywords {
-		if strings.Contains(finding, keyword) {
-			return "medium"
-		}
+	if containsAny(finding, mediumSeverityKeywords) {
+		return "medium"
 	}
-	
+
 	return "low"
 }
 
@@ -0,0 +1,116 @@
+package emba
+
+import (
+	"errors"
+	"io"
+	"os"
+	"path/filepath"
+	"reflect"
+	"strings"
+	"testing"
+)
+
+func TestOpenTextFile(t *testing.T) {
+	dir := t.TempDir()
+
+	textPath := filepath.Join(dir, "P02_firmware_bin_file_check.txt")
+	if err := os.WriteFile(textPath, []byte("kernel version 4.14\n"), 0644); err != nil {
+		t.Fatal(err)
+	}
+	binPath := filepath.Join(dir, "P99_binary")
+	if err := os.WriteFile(binPath, []byte("\x7fELF\x00\x01"), 0644); err != nil {
+		t.Fatal(err)
+	}
+	subDir := filepath.Join(dir, "P60_deep_extractor")
+	if err := os.Mkdir(subDir, 0755); err != nil {
+		t.Fatal(err)
+	}
+
+	// A text file comes back rewound to the start
+	file, err := openTextFile(textPath)
+	if err != nil {
+		t.Fatalf("text file: %v", err)
+	}
+	content, err := io.ReadAll(file)
+	file.Close()
+	if err != nil {
+		t.Fatal(err)
+	}
+	if string(content) != "kernel version 4.14\n" {
+		t.Errorf("content = %q", content)
+	}
+
+	// Binaries and directories are skipped without being errors worth logging
+	for _, path := range []string{binPath, subDir} {
+		if _, err := openTextFile(path); !errors.Is(err, errNotText) {
+			t.Errorf("%s: err = %v, want errNotText", filepath.Base(path), err)
+		}
+	}
+
+	// Real I/O failures are reported as such
+	_, err = openTextFile(filepath.Join(dir, "missing"))
+	if err == nil || errors.Is(err, errNotText) {
+		t.Errorf("missing file: err = %v, want an open error", err)
+	}
+}
+
+// scanAll returns every line newLineScanner yields for input
+func scanAll(t *testing.T, input string) []string {
+	t.Helper()
+
+	var lines []string
+	scanner := newLineScanner(strings.NewReader(input))
+	for scanner.Scan() {
+		lines = append(lines, scanner.Text())
+	}
+	if err := scanner.Err(); err != nil {
+		t.Fatalf("scan error: %v", err)
+	}
+	return lines
+}
+
+func TestNewLineScanner(t *testing.T) {
+	oversized := strings.Repeat("x", 3*maxLogLineSize)
+	longest := strings.Repeat("y", maxLogLineSize-1)
+
+	tests := []struct {
+		name  string
+		input string
+		want  []string
+	}{
+		{
+			name:  "oversized line is skipped, later lines kept",
+			input: "first\n" + oversized + "\nsecond\nthird\n",
+			want:  []string{"first", "second", "third"},
+		},
+		{
+			name:  "oversized final line without newline",
+			input: "first\n" + oversized,
+			want:  []string{"first"},
+		},
+		{
+			name:  "line just under the limit is returned",
+			input: longest + "\nafter\n",
+			want:  []string{longest, "after"},
+		},
+		{
+			name:  "CRLF endings",
+			input: "one\r\ntwo\r\n",
+			want:  []string{"one", "two"},
+		},
+		{
+			name:  "final line without newline",
+			input: "one\ntwo",
+			want:  []string{"one", "two"},
+		},
+	}
+
+	for _, tt := range tests {
+		t.Run(tt.name, func(t *testing.T) {
+			got := scanAll(t, tt.input)
+			if !reflect.DeepEqual(got, tt.want) {
+				t.Errorf("got %d lines %.40q, want %d lines %.40q", len(got), got, len(tt.want), tt.want)
+			}
+		})
+	}
+}
@@ -2,7 +2,8 @@ package handlers
 
 import (
 	"crypto/sha256"
-	"encoding/json"
+	"encoding/hex"
+	"errors"
 	"fmt"
 	"io"
 	"log"
@@ -42,14 +43,34 @@ func (h *Handler) HealthCheck(c *gin.Context) {
 	})
 }
 
+// uploadBufferSize is the chunk size used when streaming uploads to disk
+const uploadBufferSize = 1 << 20 // 1 MiB
+
+// maxFormFieldSize caps the size of non-file multipart form fields
+const maxFormFieldSize = 64 << 10 // 64 KiB
+
+// maxFormOverhead is the request body allowance on top of MaxFileSize for
+// multipart boundaries, part headers and metadata fields
+const maxFormOverhead = 1 << 20 // 1 MiB
+
+// statusColumns are the project columns returned by GetAnalysisStatus
+var statusColumns = []string{"id", "status", "risk_level", "created_at", "updated_at", "completed_at"}
+
+// errFileTooLarge is returned when an upload exceeds the configured maximum size
+var errFileTooLarge = errors.New("file exceeds maximum upload size")
+
 // UploadFirmware handles firmware file upload and starts analysis
 func (h *Handler) UploadFirmware(c *gin.Context) {
 	// Log request details for debugging
 	log.Printf("Upload request from %s - Content-Type: %s", c.ClientIP(), c.GetHeader("Content-Type"))
 	log.Printf("Request headers: %+v", c.Request.Header)
-	
-	// Parse multipart form
-	err := c.Request.ParseMultipartForm(h.config.MaxFileSize)
+
+	// Reject oversized bodies while reading instead of after the fact
+	c.Request.Body = http.MaxBytesReader(c.Writer, c.Request.Body, h.config.MaxFileSize+maxFormOverhead)
+
+	// Stream the multipart body part by part instead of using ParseMultipartForm,
+	// which buffers up to MaxFileSize bytes of firmware in memory
+	reader, err := c.Request.MultipartReader()
 	if err != nil {
 		log.Printf("Failed to parse multipart form: %v", err)
 		c.JSON(http.StatusBadRequest, gin.H{
@@ -59,110 +80,131 @@ func (h *Handler) UploadFirmware(c *gin.Context) {
 		return
 	}
 
-	// Log form fields for debugging
-	log.Printf("Form fields: %+v", c.Request.Form)
-	log.Printf("Multipart form: %+v", c.Request.MultipartForm)
-	
-	// Get file from form
-	file, header, err := c.Request.FormFile("firmware_file")
-	if err != nil {
-		log.Printf("Failed to get firmware_file from form: %v", err)
-		c.JSON(http.StatusBadRequest, gin.H{
-			"error":   "No firmware file provided",
-			"message": "Please provide a firmware file",
-		})
-		return
-	}
-	defer file.Close()
-
-	// Validate file extension
-	ext := strings.ToLower(filepath.Ext(header.Filename))
-	validExt := false
-	for _, supportedExt := range h.config.SupportedExtensions {
-		if ext == supportedExt {
-			validExt = true
+	jobID := uuid.New().String()
+	formValues := make(map[string]string)
+	var (
+		originalName string
+		ext          string
+		filePath     string
+		fileSize     int64
+		fileHash     string
+	)
+
+	for {
+		part, err := reader.NextPart()
+		if err == io.EOF {
 			break
 		}
-	}
-	if !validExt {
-		c.JSON(http.StatusBadRequest, gin.H{
-			"error":   "Unsupported file type",
-			"message": fmt.Sprintf("Supported extensions: %s", strings.Join(h.config.SupportedExtensions, ", ")),
-		})
-		return
-	}
+		if err != nil {
+			if filePath != "" {
+				os.Remove(filePath)
+			}
+			if isTooLarge(err) {
+				h.rejectTooLarge(c)
+				return
+			}
+			log.Printf("Failed to read multipart part: %v", err)
+			c.JSON(http.StatusBadRequest, gin.H{
+				"error":   "Failed to parse form",
+				"message": err.Error(),
+			})
+			return
+		}
 
-	// Validate file size
-	if header.Size > h.config.MaxFileSize {
-		c.JSON(http.StatusBadRequest, gin.H{
-			"error":   "File too large",
-			"message": fmt.Sprintf("Maximum file size: %d bytes", h.config.MaxFileSize),
-		})
-		return
-	}
+		if part.FormName() != "firmware_file" || filePath != "" {
+			// Regular form field
+			value, err := io.ReadAll(io.LimitReader(part, maxFormFieldSize))
+			part.Close()
+			if err == nil && part.FileName() == "" {
+				formValues[part.FormName()] = string(value)
+			}
+			continue
+		}
 
-	// Create upload directory if it doesn't exist
-	err = os.MkdirAll(h.config.UploadDir, 0755)
-	if err != nil {
-		c.JSON(http.StatusInternalServerError, gin.H{
-			"error":   "Failed to create upload directory",
-			"message": err.Error(),
-		})
-		return
-	}
+		originalName = part.FileName()
 
-	// Generate unique filename
-	jobID := uuid.New().String()
-	filename := fmt.Sprintf("%s_%s", jobID, header.Filename)
-	filePath := filepath.Join(h.config.UploadDir, filename)
+		// Validate file extension before writing anything to disk
+		ext = strings.ToLower(filepath.Ext(originalName))
+		validExt := false
+		for _, supportedExt := range h.config.SupportedExtensions {
+			if ext == supportedExt {
+				validExt = true
+				break
+			}
+		}
+		if !validExt {
+			part.Close()
+			c.JSON(http.StatusBadRequest, gin.H{
+				"error":   "Unsupported file type",
+				"message": fmt.Sprintf("Supported extensions: %s", strings.Join(h.config.SupportedExtensions, ", ")),
+			})
+			return
+		}
 
-	// Save file to disk
-	dst, err := os.Create(filePath)
-	if err != nil {
-		c.JSON(http.StatusInternalServerError, gin.H{
-			"error":   "Failed to save file",
-			"message": err.Error(),
-		})
-		return
+		// Create upload directory if it doesn't exist
+		if err := os.MkdirAll(h.config.UploadDir, 0755); err != nil {
+			part.Close()
+			c.JSON(http.StatusInternalServerError, gin.H{
+				"error":   "Failed to create upload directory",
+				"message": err.Error(),
+			})
+			return
+		}
+
+		// Generate unique filename
+		filePath = filepath.Join(h.config.UploadDir, fmt.Sprintf("%s_%s", jobID, originalName))
+
+		// Write file content and calculate hash in a single pass
+		fileSize, fileHash, err = saveUpload(part, filePath, h.config.MaxFileSize)
+		part.Close()
+		if err != nil {
+			os.Remove(filePath)
+			if isTooLarge(err) {
+				h.rejectTooLarge(c)
+				return
+			}
+			c.JSON(http.StatusInternalServerError, gin.H{
+				"error":   "Failed to save file",
+				"message": err.Error(),
+			})
+			return
+		}
 	}
-	defer dst.Close()
 
-	// Copy file content and calculate hash
-	hasher := sha256.New()
-	writer := io.MultiWriter(dst, hasher)
-	_, err = io.Copy(writer, file)
-	if err != nil {
-		c.JSON(http.StatusInternalServerError, gin.H{
-			"error":   "Failed to save file",
-			"message": err.Error(),
+	// Log form fields for debugging
+	log.Printf("Form fields: %+v", formValues)
+
+	if filePath == "" {
+		log.Printf("No firmware_file part in upload from %s", c.ClientIP())
+		c.JSON(http.StatusBadRequest, gin.H{
+			"error":   "No firmware file provided",
+			"message": "Please provide a firmware file",
 		})
 		return
 	}
 
-	fileHash := fmt.Sprintf("%x", hasher.Sum(nil))
-
 	// Get project metadata from form
-	projectName := c.Request.FormValue("project_name")
+	projectName := formValues["project_name"]
 	if projectName == "" {
-		projectName = strings.TrimSuffix(header.Filename, ext)
+		projectName = strings.TrimSuffix(originalName, ext)
 	}
 
 	// Create project record
 	project := &models.Project{
-		ID:          jobID,
-		Name:        projectName,
-		Description: c.Request.FormValue("description"),
-		Status:      models.StatusPending,
-		Filename:    header.Filename,
-		FilePath:    filePath,
-		FileSize:    header.Size,
-		FileHash:    fileHash,
-		DeviceName:  c.Request.FormValue("device_name"),
-		DeviceModel: c.Request.FormValue("device_model"),
-		DeviceVersion: c.Request.FormValue("device_version"),
-		Manufacturer: c.Request.FormValue("manufacturer"),
-		FirmwareInfo: "{}",
-		ExtractionResults: "{}",
+		ID:                jobID,
+		Name:              projectName,
+		Description:       formValues["description"],
+		Status:            models.StatusPending,
+		Filename:          originalName,
+		FilePath:          filePath,
+		FileSize:          fileSize,
+		FileHash:          fileHash,
+		DeviceName:        formValues["device_name"],
+		DeviceModel:       formValues["device_model"],
+		DeviceVersion:     formValues["device_version"],
+		Manufacturer:      formValues["manufacturer"],
+		FirmwareInfo:      models.JSONMap{},
+		ExtractionResults: models.JSONMap{},
 	}
 
 	// Save project to database
@@ -189,8 +231,8 @@ func (h *Handler) UploadFirmware(c *gin.Context) {
 		"project_id": jobID,
 		"status":     "QUEUED",
 		"message":    "Firmware uploaded successfully, analysis queued",
-		"filename":   header.Filename,
-		"file_size":  header.Size,
+		"filename":   originalName,
+		"file_size":  fileSize,
 		"file_hash":  fileHash,
 	})
 }
@@ -199,8 +241,9 @@ func (h *Handler) UploadFirmware(c *gin.Context) {
 func (h *Handler) GetAnalysisStatus(c *gin.Context) {
 	jobID := c.Param("job_id")
 
+	// Status is polled frequently, so only load the columns it reports
 	var project models.Project
-	if err := h.db.First(&project, "id = ?", jobID).Error; err != nil {
+	if err := h.db.Select(statusColumns).First(&project, "id = ?", jobID).Error; err != nil {
 		if err == gorm.ErrRecordNotFound {
 			c.JSON(http.StatusNotFound, gin.H{
 				"error":   "Job not found",
@@ -231,8 +274,7 @@ func (h *Handler) GetAnalysisResults(c *gin.Context) {
 	jobID := c.Param("job_id")
 
 	var project models.Project
-	if err := h.db.Preload("Findings").Preload("CVEFindings").Preload("OSINTResults").
-		First(&project, "id = ?", jobID).Error; err != nil {
+	if err := h.db.First(&project, "id = ?", jobID).Error; err != nil {
 		if err == gorm.ErrRecordNotFound {
 			c.JSON(http.StatusNotFound, gin.H{
 				"error":   "Job not found",
@@ -257,6 +299,16 @@ func (h *Handler) GetAnalysisResults(c *gin.Context) {
 		return
 	}
 
+	// Load result collections only once the analysis has completed, so
+	// polling clients don't pull every finding while the job is running
+	if err := h.loadProjectResults(&project); err != nil {
+		c.JSON(http.StatusInternalServerError, gin.H{
+			"error":   "Database error",
+			"message": err.Error(),
+		})
+		return
+	}
+
 	// Calculate summary statistics
 	summary := gin.H{
 		"total_findings":   len(project.Findings),
@@ -266,18 +318,16 @@ func (h *Handler) GetAnalysisResults(c *gin.Context) {
 		"analysis_time":   project.CompletedAt,
 	}
 
-	// Count findings by severity
+	// Count findings by severity from the rows already loaded above
 	severityCounts := map[models.RiskLevel]int{
 		models.RiskLow:      0,
 		models.RiskMedium:   0,
 		models.RiskHigh:     0,
 		models.RiskCritical: 0,
 	}
-
 	for _, finding := range project.Findings {
 		severityCounts[finding.Severity]++
 	}
-
 	for _, cve := range project.CVEFindings {
 		severityCounts[cve.SeverityLevel]++
 	}
@@ -296,6 +346,17 @@ func (h *Handler) GetAnalysisResults(c *gin.Context) {
 	})
 }
 
+// loadProjectResults loads the findings, CVE findings and OSINT results of a project
+func (h *Handler) loadProjectResults(project *models.Project) error {
+	if err := h.db.Where("project_id = ?", project.ID).Find(&project.Findings).Error; err != nil {
+		return err
+	}
+	if err := h.db.Where("project_id = ?", project.ID).Find(&project.CVEFindings).Error; err != nil {
+		return err
+	}
+	return h.db.Where("project_id = ?", project.ID).Find(&project.OSINTResults).Error
+}
+
 // DeleteAnalysis deletes an analysis job and its results
 func (h *Handler) DeleteAnalysis(c *gin.Context) {
 	jobID := c.Param("job_id")
@@ -337,6 +398,12 @@ func (h *Handler) DeleteAnalysis(c *gin.Context) {
 	})
 }
 
+// Upper bounds for the ListProjects limit and offset query parameters
+const (
+	maxListLimit  = 200
+	maxListOffset = 100000
+)
+
 // ListProjects returns a list of all projects (for compatibility)
 func (h *Handler) ListProjects(c *gin.Context) {
 	var projects []models.Project
@@ -345,14 +412,14 @@ func (h *Handler) ListProjects(c *gin.Context) {
 	limit := 50 // default
 	if l := c.Query("limit"); l != "" {
 		if parsed, err := strconv.Atoi(l); err == nil && parsed > 0 {
-			limit = parsed
+			limit = min(parsed, maxListLimit)
 		}
 	}
 
 	offset := 0
 	if o := c.Query("offset"); o != "" {
 		if parsed, err := strconv.Atoi(o); err == nil && parsed >= 0 {
-			offset = parsed
+			offset = min(parsed, maxListOffset)
 		}
 	}
 
@@ -425,20 +492,14 @@ func (h *Handler) GetEMBAReport(c *gin.Context) {
 
 	// Check for EMBA report in extraction results
 	reportPath := ""
-	if project.ExtractionResults != "" && project.ExtractionResults != "{}" {
-		// Parse JSON string to get log directory
-		var extractionData map[string]interface{}
-		if err := json.Unmarshal([]byte(project.ExtractionResults), &extractionData); err == nil {
-			if logDir, ok := extractionData["emba_log_dir"].(string); ok {
-				// Look for HTML report files
-				reportPath = filepath.Join(logDir, "html-report", "index.html")
-				if _, err := os.Stat(reportPath); os.IsNotExist(err) {
-					// Try alternative paths
-					reportPath = filepath.Join(logDir, "report.html")
-					if _, err := os.Stat(reportPath); os.IsNotExist(err) {
-						reportPath = ""
-					}
-				}
+	if logDir, ok := project.ExtractionResults["emba_log_dir"].(string); ok {
+		// Look for HTML report files
+		reportPath = filepath.Join(logDir, "html-report", "index.html")
+		if _, err := os.Stat(reportPath); os.IsNotExist(err) {
+			// Try alternative paths
+			reportPath = filepath.Join(logDir, "report.html")
+			if _, err := os.Stat(reportPath); os.IsNotExist(err) {
+				reportPath = ""
 			}
 		}
 	}
@@ -517,16 +578,7 @@ func (h *Handler) GetEMBALogs(c *gin.Context) {
 	}
 
 	// Get log directory from extraction results
-	logDir := ""
-	if project.ExtractionResults != "" && project.ExtractionResults != "{}" {
-		// Parse JSON string to get log directory
-		var extractionData map[string]interface{}
-		if err := json.Unmarshal([]byte(project.ExtractionResults), &extractionData); err == nil {
-			if dir, ok := extractionData["emba_log_dir"].(string); ok {
-				logDir = dir
-			}
-		}
-	}
+	logDir, _ := project.ExtractionResults["emba_log_dir"].(string)
 
 	if logDir == "" {
 		c.JSON(http.StatusNotFound, gin.H{
@@ -536,13 +588,18 @@ func (h *Handler) GetEMBALogs(c *gin.Context) {
 		return
 	}
 
-	// List log files
+	// List log files; WalkDir reads entry types from the directory listing,
+	// so only files (for their size) are stat'ed
 	var logFiles []gin.H
-	err := filepath.Walk(logDir, func(path string, info os.FileInfo, err error) error {
+	err := filepath.WalkDir(logDir, func(path string, d os.DirEntry, err error) error {
 		if err != nil {
 			return nil // Skip errors
 		}
-		if !info.IsDir() {
+		if !d.IsDir() {
+			info, err := d.Info()
+			if err != nil {
+				return nil
+			}
 			relPath, _ := filepath.Rel(logDir, path)
 			logFiles = append(logFiles, gin.H{
 				"name": info.Name(),
@@ -753,3 +810,40 @@ func (h *Handler) getProgressMessage(status models.ProjectStatus) string {
 		return "Processing..."
 	}
 }
+
+// rejectTooLarge responds to an upload that exceeds the maximum file size
+func (h *Handler) rejectTooLarge(c *gin.Context) {
+	c.JSON(http.StatusRequestEntityTooLarge, gin.H{
+		"error":   "File too large",
+		"message": fmt.Sprintf("Maximum file size: %d bytes", h.config.MaxFileSize),
+	})
+}
+
+// isTooLarge reports whether err comes from an upload size limit
+func isTooLarge(err error) bool {
+	var maxBytesErr *http.MaxBytesError
+	return errors.Is(err, errFileTooLarge) || errors.As(err, &maxBytesErr)
+}
+
+// saveUpload streams an uploaded file to disk in fixed-size chunks, hashing
+// the content in the same pass so memory use stays bounded by the buffer size.
+// It stops with errFileTooLarge as soon as more than maxSize bytes arrive
+func saveUpload(src io.Reader, filePath string, maxSize int64) (int64, string, error) {
+	dst, err := os.Create(filePath)
+	if err != nil {
+		return 0, "", err
+	}
+	defer dst.Close()
+
+	hasher := sha256.New()
+	limited := io.LimitReader(src, maxSize+1)
+	written, err := io.CopyBuffer(io.MultiWriter(dst, hasher), limited, make([]byte, uploadBufferSize))
+	if err != nil {
+		return written, "", err
+	}
+	if written > maxSize {
+		return written, "", errFileTooLarge
+	}
+
+	return written, hex.EncodeToString(hasher.Sum(nil)), dst.Close()
+}
@@ -0,0 +1,89 @@
+package handlers
+
+import (
+	"bytes"
+	"crypto/sha256"
+	"encoding/hex"
+	"errors"
+	"io"
+	"net/http"
+	"net/http/httptest"
+	"os"
+	"path/filepath"
+	"strings"
+	"testing"
+)
+
+func TestSaveUploadAtLimit(t *testing.T) {
+	const maxSize = 4096
+	content := bytes.Repeat([]byte("odin"), maxSize/4)
+	filePath := filepath.Join(t.TempDir(), "firmware.bin")
+
+	size, hash, err := saveUpload(bytes.NewReader(content), filePath, maxSize)
+	if err != nil {
+		t.Fatalf("saveUpload: %v", err)
+	}
+	if size != maxSize {
+		t.Errorf("size = %d, want %d", size, maxSize)
+	}
+
+	sum := sha256.Sum256(content)
+	if want := hex.EncodeToString(sum[:]); hash != want {
+		t.Errorf("hash = %s, want %s", hash, want)
+	}
+
+	written, err := os.ReadFile(filePath)
+	if err != nil {
+		t.Fatalf("reading saved file: %v", err)
+	}
+	if !bytes.Equal(written, content) {
+		t.Errorf("saved file differs from upload")
+	}
+}
+
+func TestSaveUploadOverLimit(t *testing.T) {
+	const maxSize = 4096
+	content := make([]byte, maxSize+1)
+	filePath := filepath.Join(t.TempDir(), "firmware.bin")
+
+	_, hash, err := saveUpload(bytes.NewReader(content), filePath, maxSize)
+	if !errors.Is(err, errFileTooLarge) {
+		t.Fatalf("err = %v, want errFileTooLarge", err)
+	}
+	if hash != "" {
+		t.Errorf("hash = %q, want empty", hash)
+	}
+}
+
+func TestSaveUploadEmpty(t *testing.T) {
+	filePath := filepath.Join(t.TempDir(), "firmware.bin")
+
+	size, hash, err := saveUpload(strings.NewReader(""), filePath, 4096)
+	if err != nil {
+		t.Fatalf("saveUpload: %v", err)
+	}
+	if size != 0 {
+		t.Errorf("size = %d, want 0", size)
+	}
+	sum := sha256.Sum256(nil)
+	if want := hex.EncodeToString(sum[:]); hash != want {
+		t.Errorf("hash = %s, want %s", hash, want)
+	}
+}
+
+func TestIsTooLarge(t *testing.T) {
+	// Both the per-file limit and the request body limit map to 413
+	if !isTooLarge(errFileTooLarge) {
+		t.Error("errFileTooLarge not reported as too large")
+	}
+
+	body := http.MaxBytesReader(httptest.NewRecorder(), io.NopCloser(strings.NewReader("0123456789")), 4)
+	_, err := io.ReadAll(body)
+	if !isTooLarge(err) {
+		t.Errorf("MaxBytesReader error %v not reported as too large", err)
+	}
+
+	if isTooLarge(io.ErrUnexpectedEOF) {
+		t.Error("unrelated error reported as too large")
+	}
+}
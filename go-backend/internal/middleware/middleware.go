@@ -44,6 +44,10 @@ func Logger() gin.HandlerFunc {
 	})
 }
 
+// internalErrorBody is the fixed response for unexpected errors. It never
+// changes, so it is encoded once instead of on every failed request
+var internalErrorBody = []byte(`{"error":"Internal server error","message":"An unexpected error occurred"}`)
+
 // ErrorHandler middleware for centralized error handling
 func ErrorHandler() gin.HandlerFunc {
 	return func(c *gin.Context) {
@@ -66,10 +70,7 @@ func ErrorHandler() gin.HandlerFunc {
 					"message": err.Error(),
 				})
 			default:
-				c.JSON(http.StatusInternalServerError, gin.H{
-					"error":   "Internal server error",
-					"message": "An unexpected error occurred",
-				})
+				c.Data(http.StatusInternalServerError, "application/json; charset=utf-8", internalErrorBody)
 			}
 		}
 	}
@@ -1,6 +1,9 @@
 package models
 
 import (
+	"database/sql/driver"
+	"encoding/json"
+	"fmt"
 	"time"
 
 	"github.com/google/uuid"
@@ -44,12 +47,49 @@ const (
 	FindingSecurityIssue FindingType = "security_issue"
 )
 
+// JSONMap is a free-form JSON object stored in a text column
+type JSONMap map[string]interface{}
+
+// Value serializes the map to JSON for storage
+func (m JSONMap) Value() (driver.Value, error) {
+	if m == nil {
+		return nil, nil
+	}
+	data, err := json.Marshal(m)
+	if err != nil {
+		return nil, err
+	}
+	return string(data), nil
+}
+
+// Scan deserializes a stored JSON object
+func (m *JSONMap) Scan(value interface{}) error {
+	var data []byte
+	switch v := value.(type) {
+	case nil:
+		*m = nil
+		return nil
+	case []byte:
+		data = v
+	case string:
+		data = []byte(v)
+	default:
+		return fmt.Errorf("unsupported JSONMap source type %T", value)
+	}
+
+	if len(data) == 0 {
+		*m = nil
+		return nil
+	}
+	return json.Unmarshal(data, m)
+}
+
 // Project represents a firmware analysis project
 type Project struct {
 	ID          string        `gorm:"primaryKey;type:varchar(36)" json:"id"`
 	Name        string        `gorm:"not null" json:"name"`
 	Description string        `json:"description"`
-	Status      ProjectStatus `gorm:"default:pending" json:"status"`
+	Status      ProjectStatus `gorm:"default:pending;index" json:"status"`
 	RiskLevel   RiskLevel     `gorm:"default:low" json:"risk_level"`
 
 	// File information
@@ -65,11 +105,11 @@ type Project struct {
 	Manufacturer  string `json:"manufacturer"`
 
 	// Analysis results (JSON fields)
-	FirmwareInfo      string `gorm:"type:text" json:"firmware_info"`
-	ExtractionResults string `gorm:"type:text" json:"extraction_results"`
+	FirmwareInfo      JSONMap `gorm:"type:text" json:"firmware_info"`
+	ExtractionResults JSONMap `gorm:"type:text" json:"extraction_results"`
 
 	// Timestamps
-	CreatedAt   time.Time  `json:"created_at"`
+	CreatedAt   time.Time  `gorm:"index" json:"created_at"`
 	UpdatedAt   time.Time  `json:"updated_at"`
 	CompletedAt *time.Time `json:"completed_at"`
 
@@ -90,20 +130,20 @@ func (p *Project) BeforeCreate(tx *gorm.DB) error {
 // Finding represents a security finding from analysis
 type Finding struct {
 	ID        uint        `gorm:"primaryKey" json:"id"`
-	ProjectID string      `gorm:"not null;index" json:"project_id"`
+	ProjectID string      `gorm:"not null;index:idx_findings_project_severity,priority:1" json:"project_id"`
 	Type      FindingType `gorm:"not null" json:"type"`
 	Title     string      `gorm:"not null" json:"title"`
 	Description string    `json:"description"`
-	Severity    RiskLevel `gorm:"default:low" json:"severity"`
+	Severity    RiskLevel `gorm:"default:low;index:idx_findings_project_severity,priority:2" json:"severity"`
 
 	// Location information
 	FilePath   string `json:"file_path"`
 	LineNumber int    `json:"line_number"`
 
 	// Finding data
-	Content         string `json:"content"`
-	Context         string `json:"context"`
-	FindingMetadata string `gorm:"type:text" json:"finding_metadata"`
+	Content         string  `json:"content"`
+	Context         string  `json:"context"`
+	FindingMetadata JSONMap `gorm:"type:text" json:"finding_metadata"`
 
 	CreatedAt time.Time `json:"created_at"`
 
@@ -114,7 +154,7 @@ type Finding struct {
 // CVEFinding represents a CVE vulnerability finding
 type CVEFinding struct {
 	ID        uint   `gorm:"primaryKey" json:"id"`
-	ProjectID string `gorm:"not null;index" json:"project_id"`
+	ProjectID string `gorm:"not null;index:idx_cve_findings_project_severity,priority:1" json:"project_id"`
 
 	CVEID           string `gorm:"not null" json:"cve_id"`
 	SoftwareName    string `gorm:"not null" json:"software_name"`
@@ -123,7 +163,7 @@ type CVEFinding struct {
 	// CVE details
 	Description   string    `json:"description"`
 	SeverityScore float64   `json:"severity_score"`
-	SeverityLevel RiskLevel `json:"severity_level"`
+	SeverityLevel RiskLevel `gorm:"index:idx_cve_findings_project_severity,priority:2" json:"severity_level"`
 
 	// References (JSON array)
 	References string `gorm:"type:text" json:"references"`
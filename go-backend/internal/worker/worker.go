@@ -4,8 +4,10 @@ import (
 	"fmt"
 	"log"
 	"odin-backend/internal/config"
+	"odin-backend/internal/database"
 	"odin-backend/internal/emba"
 	"odin-backend/internal/models"
+	"sync"
 	"time"
 
 	"gorm.io/gorm"
@@ -15,18 +17,40 @@ type Worker struct {
 	db     *gorm.DB
 	config *config.Config
 	emba   *emba.Service
+
+	// slots bounds how many projects are analyzed at once. It lives as long
+	// as the worker, so a slot freed by a finished run is reused on the
+	// next poll instead of waiting for the rest of its batch
+	slots chan struct{}
+
+	// inFlight holds the IDs of projects being analyzed, so a project that
+	// is still pending when the next poll runs is not started twice
+	inFlightMu sync.Mutex
+	inFlight   map[string]struct{}
 }
 
 func New(db *gorm.DB, cfg *config.Config) *Worker {
 	embaService := emba.New(cfg)
+
+	// EMBA runs are dominated by external process time, so up to
+	// WorkerConcurrency projects are analyzed at once
+	concurrency := cfg.WorkerConcurrency
+	if concurrency < 1 {
+		concurrency = 1
+	}
+
 	return &Worker{
-		db:     db,
-		config: cfg,
-		emba:   embaService,
+		db:       db,
+		config:   cfg,
+		emba:     embaService,
+		slots:    make(chan struct{}, concurrency),
+		inFlight: make(map[string]struct{}),
 	}
 }
 
-// ProcessPendingJobs polls for pending analysis jobs and processes them
+// ProcessPendingJobs polls for pending analysis jobs and starts as many as
+// there are free slots. It does not wait for them to finish; projects left
+// over stay pending and are picked up by a later poll
 func (w *Worker) ProcessPendingJobs() error {
 	var projects []models.Project
 	
@@ -35,17 +59,57 @@ func (w *Worker) ProcessPendingJobs() error {
 		return fmt.Errorf("failed to query pending projects: %w", err)
 	}
 
-	for _, project := range projects {
-		log.Printf("Processing pending project: %s (ID: %d)", project.Name, project.ID)
-		if err := w.processProject(&project); err != nil {
-			log.Printf("Failed to process project %d: %v", project.ID, err)
-			w.updateProjectStatus(&project, models.StatusFailed, fmt.Sprintf("Processing failed: %v", err))
+	for i := range projects {
+		project := &projects[i]
+		if !w.claim(project.ID) {
+			continue
+		}
+
+		select {
+		case w.slots <- struct{}{}:
+		default:
+			// Every slot is busy
+			w.release(project.ID)
+			return nil
 		}
+
+		go func() {
+			defer func() {
+				<-w.slots
+				w.release(project.ID)
+			}()
+
+			log.Printf("Processing pending project: %s (ID: %s)", project.Name, project.ID)
+			if err := w.processProject(project); err != nil {
+				log.Printf("Failed to process project %s: %v", project.ID, err)
+				w.updateProjectStatus(project, models.StatusFailed, fmt.Sprintf("Processing failed: %v", err))
+			}
+		}()
 	}
 
 	return nil
 }
 
+// claim marks a project as in flight, reporting false if it already is
+func (w *Worker) claim(projectID string) bool {
+	w.inFlightMu.Lock()
+	defer w.inFlightMu.Unlock()
+
+	if _, ok := w.inFlight[projectID]; ok {
+		return false
+	}
+	w.inFlight[projectID] = struct{}{}
+	return true
+}
+
+// release clears a project's in-flight mark
+func (w *Worker) release(projectID string) {
+	w.inFlightMu.Lock()
+	defer w.inFlightMu.Unlock()
+
+	delete(w.inFlight, projectID)
+}
+
 // processProject processes a single firmware analysis project
 func (w *Worker) processProject(project *models.Project) error {
 	log.Printf("Starting firmware analysis for project %s", project.Name)
@@ -56,7 +120,7 @@ func (w *Worker) processProject(project *models.Project) error {
 	}
 
 	// Run EMBA analysis
-	result, err := w.emba.AnalyzeFirmware(project.FilePath, fmt.Sprintf("job_%d", project.ID))
+	result, err := w.emba.AnalyzeFirmware(project.FilePath, fmt.Sprintf("job_%s", project.ID))
 	if err != nil {
 		log.Printf("EMBA analysis failed for project %s: %v", project.Name, err)
 		w.updateProjectStatus(project, models.StatusFailed, fmt.Sprintf("EMBA analysis failed: %v", err))
@@ -69,30 +133,25 @@ func (w *Worker) processProject(project *models.Project) error {
 		return fmt.Errorf("EMBA analysis failed: %s", result.Error)
 	}
 
-	// Parse and save EMBA results
+	// Save EMBA results, risk level and completion status in one transaction
 	if err := w.saveAnalysisResults(project, result); err != nil {
 		log.Printf("Failed to save analysis results for project %s: %v", project.Name, err)
 		w.updateProjectStatus(project, models.StatusFailed, fmt.Sprintf("Failed to save results: %v", err))
 		return fmt.Errorf("failed to save analysis results: %w", err)
 	}
 
-	// Calculate risk level
-	riskLevel := w.calculateRiskLevel(project)
-	project.RiskLevel = riskLevel
-
-	// Mark as completed
-	now := time.Now()
-	project.CompletedAt = &now
-	if err := w.updateProjectStatus(project, models.StatusCompleted, "EMBA analysis completed successfully"); err != nil {
-		return fmt.Errorf("failed to update completion status: %w", err)
-	}
-
 	log.Printf("EMBA analysis completed successfully for project %s", project.Name)
 	return nil
 }
 
 // updateProjectStatus updates the project status in database
 func (w *Worker) updateProjectStatus(project *models.Project, status models.ProjectStatus, message string) error {
+	setProjectStatus(project, status, message)
+	return w.db.Save(project).Error
+}
+
+// setProjectStatus sets the status and status message without saving
+func setProjectStatus(project *models.Project, status models.ProjectStatus, message string) {
 	project.Status = status
 	
 	// Update extraction results with status message
@@ -101,23 +160,33 @@ func (w *Worker) updateProjectStatus(project *models.Project, status models.Proj
 	}
 	project.ExtractionResults["status_message"] = message
 	project.ExtractionResults["last_updated"] = time.Now().UTC()
-
-	return w.db.Save(project).Error
 }
 
-// saveAnalysisResults saves EMBA analysis results to database
+// saveAnalysisResults saves EMBA analysis results to database and marks the
+// project completed. Everything is written in a single transaction, so a
+// failure leaves no partial results behind
 func (w *Worker) saveAnalysisResults(project *models.Project, result *emba.AnalysisResult) error {
-	// Start transaction
-	tx := w.db.Begin()
-	defer func() {
-		if r := recover(); r != nil {
-			tx.Rollback()
-		}
-	}()
+	// Update a copy so that a rolled-back transaction leaves the caller's
+	// project as it was, rather than half-marked completed
+	updated := *project
+	err := w.db.Transaction(func(tx *gorm.DB) error {
+		return w.saveAnalysisResultsTx(tx, &updated, result)
+	})
+	if err != nil {
+		return err
+	}
 
-	// Save findings
+	*project = updated
+	return nil
+}
+
+// saveAnalysisResultsTx does the work of saveAnalysisResults inside tx
+func (w *Worker) saveAnalysisResultsTx(tx *gorm.DB, project *models.Project, result *emba.AnalysisResult) error {
+	// Save findings, CVEs and OSINT results as multi-row INSERTs; the
+	// database's CreateBatchSize caps the rows per statement
+	findings := make([]models.Finding, 0, len(result.Results.Findings))
 	for _, findingData := range result.Results.Findings {
-		finding := models.Finding{
+		findings = append(findings, models.Finding{
 			ProjectID:       project.ID,
 			Type:            findingData.Type,
 			Title:           findingData.Title,
@@ -128,46 +197,49 @@ func (w *Worker) saveAnalysisResults(project *models.Project, result *emba.Analy
 			Content:         findingData.Content,
 			Context:         findingData.Context,
 			FindingMetadata: findingData.FindingMetadata,
-		}
-		if err := tx.Create(&finding).Error; err != nil {
-			tx.Rollback()
-			return fmt.Errorf("failed to save finding: %w", err)
+		})
+	}
+	if len(findings) > 0 {
+		if err := tx.Create(&findings).Error; err != nil {
+			return fmt.Errorf("failed to save findings: %w", err)
 		}
 	}
 
-	// Save CVE findings
+	cveFindings := make([]models.CVEFinding, 0, len(result.Results.CVEs))
 	for _, cveData := range result.Results.CVEs {
-		cveFinding := models.CVEFinding{
+		cveFindings = append(cveFindings, models.CVEFinding{
 			ProjectID:       project.ID,
-			CVEID:          cveData.CVEID,
-			SoftwareName:   cveData.SoftwareName,
+			CVEID:           cveData.CVEID,
+			SoftwareName:    cveData.SoftwareName,
 			SoftwareVersion: cveData.SoftwareVersion,
-			Description:    cveData.Description,
-			SeverityScore:  cveData.SeverityScore,
-			SeverityLevel:  cveData.SeverityLevel,
-			References:     cveData.References,
-		}
-		if err := tx.Create(&cveFinding).Error; err != nil {
-			tx.Rollback()
-			return fmt.Errorf("failed to save CVE finding: %w", err)
+			Description:     cveData.Description,
+			SeverityScore:   cveData.SeverityScore,
+			SeverityLevel:   cveData.SeverityLevel,
+			References:      cveData.References,
+		})
+	}
+	if len(cveFindings) > 0 {
+		if err := tx.Create(&cveFindings).Error; err != nil {
+			return fmt.Errorf("failed to save CVE findings: %w", err)
 		}
 	}
 
-	// Save OSINT results
+	osintResults := make([]models.OSINTResult, 0, len(result.Results.OSINTResults))
 	for _, osintData := range result.Results.OSINTResults {
-		osintResult := models.OSINTResult{
+		osintResults = append(osintResults, models.OSINTResult{
 			ProjectID:       project.ID,
-			Source:         osintData.Source,
-			Query:          osintData.Query,
-			Title:          osintData.Title,
-			Description:    osintData.Description,
-			URL:            osintData.URL,
-			Data:           osintData.Data,
+			Source:          osintData.Source,
+			Query:           osintData.Query,
+			Title:           osintData.Title,
+			Description:     osintData.Description,
+			URL:             osintData.URL,
+			Data:            osintData.Data,
 			ConfidenceScore: osintData.ConfidenceScore,
-		}
-		if err := tx.Create(&osintResult).Error; err != nil {
-			tx.Rollback()
-			return fmt.Errorf("failed to save OSINT result: %w", err)
+		})
+	}
+	if len(osintResults) > 0 {
+		if err := tx.Create(&osintResults).Error; err != nil {
+			return fmt.Errorf("failed to save OSINT results: %w", err)
 		}
 	}
 
@@ -186,63 +258,49 @@ func (w *Worker) saveAnalysisResults(project *models.Project, result *emba.Analy
 		project.FirmwareInfo = result.Results.FileInfo
 	}
 
+	// Calculate risk level from the rows inserted above and mark as completed
+	riskLevel, err := w.calculateRiskLevel(tx, project)
+	if err != nil {
+		return fmt.Errorf("failed to calculate risk level: %w", err)
+	}
+	project.RiskLevel = riskLevel
+	now := time.Now()
+	project.CompletedAt = &now
+	setProjectStatus(project, models.StatusCompleted, "EMBA analysis completed successfully")
+
 	if err := tx.Save(project).Error; err != nil {
-		tx.Rollback()
 		return fmt.Errorf("failed to update project: %w", err)
 	}
 
-	return tx.Commit().Error
+	return nil
 }
 
 // calculateRiskLevel calculates overall risk level based on findings
-func (w *Worker) calculateRiskLevel(project *models.Project) models.RiskLevel {
-	var findings []models.Finding
-	var cveFindings []models.CVEFinding
-
-	w.db.Where("project_id = ?", project.ID).Find(&findings)
-	w.db.Where("project_id = ?", project.ID).Find(&cveFindings)
-
-	// Count severity levels
-	criticalCount := 0
-	highCount := 0
-	mediumCount := 0
-
-	for _, finding := range findings {
-		switch finding.Severity {
-		case models.RiskCritical:
-			criticalCount++
-		case models.RiskHigh:
-			highCount++
-		case models.RiskMedium:
-			mediumCount++
-		}
+func (w *Worker) calculateRiskLevel(db *gorm.DB, project *models.Project) (models.RiskLevel, error) {
+	// Count severity levels in SQL rather than loading every row
+	counts, err := database.SeverityCounts(db, project.ID)
+	if err != nil {
+		return "", err
 	}
 
-	for _, cve := range cveFindings {
-		switch cve.SeverityLevel {
-		case models.RiskCritical:
-			criticalCount++
-		case models.RiskHigh:
-			highCount++
-		case models.RiskMedium:
-			mediumCount++
-		}
-	}
+	criticalCount := counts[models.RiskCritical]
+	highCount := counts[models.RiskHigh]
+	mediumCount := counts[models.RiskMedium]
 
 	// Determine overall risk
 	if criticalCount > 0 {
-		return models.RiskCritical
+		return models.RiskCritical, nil
 	} else if highCount >= 3 {
-		return models.RiskCritical
+		return models.RiskCritical, nil
 	} else if highCount > 0 {
-		return models.RiskHigh
+		return models.RiskHigh, nil
 	} else if mediumCount >= 5 {
-		return models.RiskHigh
+		return models.RiskHigh, nil
 	} else if mediumCount > 0 {
-		return models.RiskMedium
+		return models.RiskMedium, nil
 	}
 
-	return models.RiskLow
+	return models.RiskLow, nil
 }
 
 // mapFindingType maps EMBA finding types to our model types